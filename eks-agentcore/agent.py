@@ -3,12 +3,13 @@
 Local agent connecting to Amazon Bedrock AgentCore Memory and Gateway
 """
 
+from __future__ import annotations
+
 import logging
 import os
 import uuid
 import sys
 import json
-import requests
 import atexit
 import signal
 
@@ -23,43 +24,203 @@ except ImportError:
 except Exception as e:
     print(f"⚠️  Could not load .env.agents file: {e}")
 
-# Import boto libraries and AWS tools
-import boto3
-from boto3.session import Session
-from utils import get_ssm_parameter, put_ssm_parameter, load_api_spec, get_cognito_client_secret
-
-# Import DDGS
-from ddgs import DDGS
-from ddgs.exceptions import DDGSException, RatelimitException
+import functools
+from utils import get_ssm_parameter, get_ssm_parameters_batch, put_ssm_parameter, load_api_spec, get_cognito_client_secret
 
-# Import Strands, BedrockModel, MCP libraries
+# boto3, botocore, mcp.client, bedrock_agentcore, requests and ddgs are
+# imported lazily inside the functions that need them so paths like --help
+# and --select-model do not pay AWS SDK import cost. Strands must stay eager:
+# the @tool decorator and HookProvider base class run at module scope.
 from strands.agent import Agent
 from strands.tools import tool
 from strands.hooks import AfterInvocationEvent, HookProvider, HookRegistry, MessageAddedEvent
 from strands.models.bedrock import BedrockModel
 from strands.tools.mcp import MCPClient
-from mcp.client.streamable_http import streamablehttp_client
-from mcp.client.stdio import stdio_client, StdioServerParameters
+import operator
 import subprocess
 import asyncio
+import threading
+import time
+import types
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+
+# STS client will be initialized after region setup
 
-# Import AgentCore Memory
-from bedrock_agentcore.memory import MemoryClient
-from bedrock_agentcore.memory.constants import StrategyType
+@functools.lru_cache(maxsize=1)
+def _boto_config():
+    """Shared botocore config: pooled connections, keep-alive and adaptive retries."""
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    )
 
-# Import AgentCore Identity
-from bedrock_agentcore.identity.auth import requires_access_token
+@functools.lru_cache(maxsize=None)
+def _boto_session(region: str | None = None):
+    """Shared boto3 session per region; loading service models is the
+    expensive part of session setup, so every client should reuse one."""
+    import boto3
+    return boto3.session.Session(region_name=region)
 
-# STS client will be initialized after region setup
+@functools.lru_cache(maxsize=None)
+def _boto_client(service: str, region: str):
+    """Return a cached boto3 client for (service, region).
+
+    Client construction is expensive (credential resolution, endpoint
+    discovery, retry-config build), so reuse one pooled client per service.
+    """
+    return _boto_session(region).client(service, config=_boto_config())
+
+# On-disk cache of per-server tool metadata so warm starts (and tool listings
+# before init completes) do not need a live list_tools_sync round-trip.
+_TOOLS_CACHE_DIR = os.path.expanduser('~/.cache/eks-agent/tools')
+_TOOLS_CACHE_TTL = 3600.0  # seconds
+
+def refresh_tools_cache():
+    """Delete the on-disk tool metadata cache (--refresh-tools)."""
+    import shutil
+    shutil.rmtree(_TOOLS_CACHE_DIR, ignore_errors=True)
+    print(f"🧹 Cleared tool metadata cache at {_TOOLS_CACHE_DIR}")
+
+# Cache parsed config files keyed by mtime so repeated lookups skip the
+# open + json.load syscalls while the file is unchanged.
+_MCP_CONFIG_CACHE: dict[str, tuple[int, dict]] = {}
+
+# orjson decodes config-sized blobs several times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Names of enabled servers, derived lazily from the cached config so that
+# is_mcp_server_enabled is a single frozenset membership test.
+_ENABLED_SERVERS: frozenset[str] | None = None
+
+def _load_json_config_cached(path: str) -> dict:
+    """Parse a JSON config file, reusing the cached parse until mtime changes."""
+    global _ENABLED_SERVERS
+
+    st = os.stat(path)
+    cached = _MCP_CONFIG_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        config = _json_loads(f.read())
+    _MCP_CONFIG_CACHE[path] = (st.st_mtime_ns, config)
+    _ENABLED_SERVERS = None  # config changed; rebuild the enabled-server index
+    return config
+
+class MCPSessionPool:
+    """Caches started MCP clients so repeated agent runs reuse live sessions.
+
+    Spawning a stdio MCP server per invocation repeats the subprocess launch
+    plus the initialize handshake; keeping clients warm in-process avoids both.
+    Entries expire after a TTL and are health-checked before reuse.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}  # server_name -> (client, tools, last_used)
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    def acquire(self, server_name: str, factory):
+        """Return a cached healthy client, or create one via factory on miss."""
+        with self._lock:
+            entry = self._entries.get(server_name)
+            if entry:
+                client, tools, last_used = entry
+                if time.time() - last_used <= self.ttl_seconds and self._is_healthy(client):
+                    self._entries[server_name] = (client, tools, time.time())
+                    print(f"   ♻️  Reusing pooled MCP client for {server_name}")
+                    return (server_name, client, tools)
+                self._evict_locked(server_name)
+
+        result = factory()
+        if result is not None:
+            name, client, tools = result
+            with self._lock:
+                self._entries[name] = (client, tools, time.time())
+                if not self._atexit_registered:
+                    atexit.register(self.close_all)
+                    self._atexit_registered = True
+        return result
+
+    def release(self, server_name: str):
+        """Mark a client as recently used so its TTL window restarts."""
+        with self._lock:
+            entry = self._entries.get(server_name)
+            if entry:
+                self._entries[server_name] = (entry[0], entry[1], time.time())
+
+    @staticmethod
+    def _client_process(client):
+        """Find the underlying stdio subprocess for a client, if any."""
+        if hasattr(client, '_client_session') and hasattr(client._client_session, '_process'):
+            return client._client_session._process
+        if hasattr(client, '_session') and hasattr(client._session, '_process'):
+            return client._session._process
+        if hasattr(client, '_process'):
+            return client._process
+        return None
+
+    def _is_healthy(self, client) -> bool:
+        """Check that the client's stdio subprocess is still alive."""
+        process = self._client_process(client)
+        if process is not None and hasattr(process, 'poll'):
+            return process.poll() is None
+        return True
+
+    def _evict_locked(self, server_name: str):
+        """Remove and stop a pooled client. Caller must hold the lock."""
+        client, _tools, _last_used = self._entries.pop(server_name)
+        try:
+            client.stop(None, None, None)
+        except Exception:
+            pass
+
+    def close_all(self):
+        """Stop all pooled clients (registered with atexit)."""
+        with self._lock:
+            for server_name in list(self._entries):
+                self._evict_locked(server_name)
+
+    def kill_all_processes(self):
+        """Last-resort kill of pooled stdio subprocesses, without locking.
+
+        Used on the force-exit path when graceful cleanup timed out: the
+        hung cleanup worker may still hold the pool lock, so this snapshots
+        the entries and SIGKILLs each live child directly.
+        """
+        for client, _tools, _last_used in list(self._entries.values()):
+            process = self._client_process(client)
+            if process is not None and hasattr(process, 'poll') and process.poll() is None:
+                try:
+                    process.kill()
+                except Exception:
+                    pass
+
+# Registered MCP client plus its shutdown handles, resolved once at init time
+# so cleanup is a direct call instead of a per-client reflection cascade.
+_MCPEntry = namedtuple('_MCPEntry', ['client', 'process', 'stop'])
 
 class AWSMCPManager:
     """Manages AWS MCP tools integration."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, session_pool: MCPSessionPool | None = None):
         self.config_path = config_path
+        self.session_pool = session_pool
         self.mcp_clients = {}
         self.mcp_tools = []
         self._cleanup_registered = False
+        # Shared pool for timeout-bounded client calls; futures abandoned on
+        # timeout have their stdio subprocess terminated so nothing leaks
+        self._init_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mcp-init')
     
     def __enter__(self):
         """Context manager entry."""
@@ -75,11 +236,11 @@ class AWSMCPManager:
             if not os.path.exists(self.config_path):
                 print(f"ℹ️  AWS MCP config file not found - Bedrock AgentCore Gateway MCP tools will be used")
                 return None
-                
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-                return config.get('mcpServers', {})
-                
+
+            config = _load_json_config_cached(self.config_path)
+            return config.get('mcpServers', {})
+
+
         except Exception as e:
             print(f"❌ Error loading AWS MCP config: {e}")
             return None
@@ -91,55 +252,131 @@ class AWSMCPManager:
             print("ℹ️  No AWS MCP servers found")
             return
         
-        enabled_servers = {name: config for name, config in servers.items() 
-                          if not config.get('disabled', False)}
-        
-        print(f"🔧 Initializing {len(enabled_servers)} AWS MCP servers...")
-        
-        # Known problematic servers that often hang
-        problematic_servers = {
-            'awslabs.prometheus-mcp-server',
-            'aws-knowledge-mcp-server',
-            'awslabs.cloudwatch-mcp-server'
+        enabled_servers = self._enabled_servers_index(servers)
+        if not enabled_servers:
+            print("ℹ️  No AWS MCP servers enabled")
+            return
+
+        print(f"🔧 Initializing {len(enabled_servers)} AWS MCP servers in parallel...")
+
+        # Copy the process environment once per batch instead of per server;
+        # workers only pay a cheap dict merge for their server-specific vars.
+        base_env = os.environ.copy()
+        base_env.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+        base_env.setdefault('AWS_REGION', 'us-east-1')
+        base_env.setdefault('PYTHONWARNINGS', 'ignore')
+        base_env.setdefault('LOGURU_LEVEL', 'ERROR')
+        base_env.setdefault('LOG_LEVEL', 'ERROR')
+
+        # Startup is I/O-bound (subprocess spawn + stdio handshake), so run all
+        # workers concurrently under one deadline: total latency is bounded by
+        # the slowest per-server timeout instead of the sum of all of them.
+        deadline = max(self._init_timeout(config) for config in enabled_servers.values())
+
+        executor = ThreadPoolExecutor(max_workers=min(16, len(enabled_servers)))
+        futures = {
+            executor.submit(self._acquire_or_initialize, server_name, server_config, base_env): server_name
+            for server_name, server_config in enabled_servers.items()
         }
-        
-        for server_name, server_config in enabled_servers.items():
-            try:
-                # Use shorter timeout for known problematic servers
-                if server_name in problematic_servers:
-                    print(f"   ⚠️  {server_name} is known to be slow, using shorter timeout...")
-                
-                self._initialize_single_mcp_client(server_name, server_config)
-            except Exception as e:
-                print(f"⚠️  Failed to initialize {server_name}: {e}")
-    
-    def _initialize_single_mcp_client(self, server_name: str, server_config: dict):
-        """Initialize a single MCP client with improved timeout handling."""
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                server_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"⚠️  Failed to initialize {server_name}: {e}")
+                    continue
+
+                if result is None:
+                    continue
+
+                name, client, tools = result
+                self.mcp_clients[name] = self._resolve_shutdown(client)
+                self.mcp_tools.extend(tools)
+                print(f"✅ Initialized {name} with {len(tools)} tools")
+        except FutureTimeoutError:
+            pending = ", ".join(name for future, name in futures.items() if not future.done())
+            print(f"⚠️  MCP initialization deadline of {deadline}s reached, skipping: {pending}")
+        finally:
+            # Don't join workers stuck in client.start(); a blocking shutdown
+            # here would reintroduce the hang the deadline is meant to bound.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _enabled_servers_index(self, servers: dict) -> dict:
+        """Filter enabled servers once per config object, reusing the last result.
+
+        load_aws_mcp_config returns the same cached dict while the config file
+        is unchanged, so an identity check is enough to reuse the filter.
+        """
+        cached = getattr(self, '_enabled_cache', None)
+        if cached is not None and cached[0] is servers:
+            return cached[1]
+
+        enabled = {name: config for name, config in servers.items()
+                   if not config.get('disabled', False)}
+        self._enabled_cache = (servers, enabled)
+        return enabled
+
+    @staticmethod
+    def _resolve_shutdown(client) -> _MCPEntry:
+        """Resolve a client's subprocess and stop callable once, at registration."""
+        process = MCPSessionPool._client_process(client)
+
+        stop = getattr(client, 'stop', None)
+        if stop is not None:
+            return _MCPEntry(client, process, lambda: stop(None, None, None))
+        exit_method = getattr(client, '__exit__', None)
+        if exit_method is not None:
+            return _MCPEntry(client, process, lambda: exit_method(None, None, None))
+        close = getattr(client, 'close', None)
+        if close is not None:
+            return _MCPEntry(client, process, close)
+        return _MCPEntry(client, process, None)
+
+    @staticmethod
+    def _init_timeout(server_config: dict) -> float:
+        """Per-server init timeout: JSON `initTimeout`, then env, then default."""
+        return float(server_config.get('initTimeout')
+                     or os.environ.get('MCP_INIT_TIMEOUT')
+                     or AgentConfig.MCP_INIT_TIMEOUT)
+
+    @staticmethod
+    def _shutdown_timeout(server_config: dict) -> float:
+        """Per-server shutdown timeout: JSON `shutdownTimeout`, then env, then default."""
+        return float(server_config.get('shutdownTimeout')
+                     or os.environ.get('MCP_SHUTDOWN_TIMEOUT')
+                     or AgentConfig.MCP_SHUTDOWN_TIMEOUT)
+
+    def _acquire_or_initialize(self, server_name: str, server_config: dict, base_env: dict):
+        """Fetch a pooled client when pooling is enabled, else initialize fresh."""
+        if self.session_pool is not None and AgentConfig.MCP_SESSION_POOL:
+            return self.session_pool.acquire(
+                server_name,
+                lambda: self._initialize_single_mcp_client(server_name, server_config, base_env),
+            )
+        return self._initialize_single_mcp_client(server_name, server_config, base_env)
+
+    def _initialize_single_mcp_client(self, server_name: str, server_config: dict, base_env: dict):
+        """Initialize a single MCP client and return (server_name, client, tools).
+
+        Returns None on failure or timeout so the caller can merge results
+        without this worker mutating shared state.
+        """
         command = server_config.get('command', '')
         args = server_config.get('args', [])
         env = server_config.get('env', {})
         
         if not command:
             print(f"⚠️  No command specified for {server_name}")
-            return
-        
+            return None
+
+        from mcp.client.stdio import stdio_client, StdioServerParameters
+
         try:
-            # Create environment with current env + server env
-            full_env = os.environ.copy()
-            
-            # Ensure AWS region is set for all AWS MCP servers
-            if 'aws' in server_name.lower() or any('aws' in arg.lower() for arg in args):
-                full_env.setdefault('AWS_DEFAULT_REGION', os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'))
-                full_env.setdefault('AWS_REGION', os.environ.get('AWS_REGION', 'us-east-1'))
-            
-            # Apply server-specific environment variables
-            full_env.update(env)
-            
-            # Add additional logging suppression for all MCP servers
-            full_env.setdefault('PYTHONWARNINGS', 'ignore')
-            full_env.setdefault('LOGURU_LEVEL', 'ERROR')
-            full_env.setdefault('LOG_LEVEL', 'ERROR')
-            
+            # Merge server-specific vars onto the shared batch environment
+            # (region + logging suppression were applied once by the caller)
+            full_env = base_env | env
+
             # Create MCP client
             server_params = StdioServerParameters(
                 command=command,
@@ -159,58 +396,57 @@ class AWSMCPManager:
             tools = self._get_tools_from_client_with_timeout(client, server_name)
             
             if tools is not None:  # None means timeout, empty list means no tools
-                self.mcp_clients[server_name] = client
-                self.mcp_tools.extend(tools)
-                print(f"✅ Initialized {server_name} with {len(tools)} tools")
-            else:
-                # Timeout occurred, cleanup client
-                try:
-                    client.stop(None, None, None)
-                except:
-                    pass
-                print(f"⚠️  {server_name} tool retrieval timed out, skipping...")
-                
+                self._write_tools_metadata_cache(server_name, server_config, tools)
+                return (server_name, client, tools)
+
+            # Timeout occurred, cleanup client
+            try:
+                client.stop(None, None, None)
+            except:
+                pass
+            print(f"⚠️  {server_name} tool retrieval timed out, skipping...")
+            return None
+
         except Exception as e:
             print(f"⚠️  Failed to start {server_name}: {e}")
-            return
+            return None
     
-    def _get_tools_from_client_with_timeout(self, client, server_name: str, timeout: float = 10.0):
+    def _get_tools_from_client_with_timeout(self, client, server_name: str, timeout: float | None = None):
         """Get tools from an MCP client with timeout."""
-        import threading
-        import time
-        
-        result = {'tools': None, 'error': None}
-        
-        def get_tools_worker():
-            """Worker function to get tools."""
-            try:
-                tools = client.list_tools_sync()
-                result['tools'] = tools
-            except Exception as e:
-                result['error'] = e
-        
-        # Run tool retrieval with timeout
-        worker_thread = threading.Thread(target=get_tools_worker, daemon=True)
-        worker_thread.start()
-        worker_thread.join(timeout=timeout)
-        
-        if worker_thread.is_alive():
-            # Timeout occurred
+        if timeout is None:
+            timeout = float(os.environ.get('MCP_TOOL_LIST_TIMEOUT')
+                            or AgentConfig.MCP_TOOL_LIST_TIMEOUT)
+
+        future = self._init_pool.submit(client.list_tools_sync)
+        try:
+            tools = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # The abandoned worker would keep the stdio handshake running and
+            # hold a file descriptor until exit; terminate the subprocess so
+            # repeated restarts do not accumulate leaked processes.
+            process = MCPSessionPool._client_process(client)
+            if process is not None and hasattr(process, 'poll') and process.poll() is None:
+                try:
+                    process.terminate()
+                    try:
+                        process.wait(timeout=0.1)
+                    except Exception:
+                        process.kill()
+                except Exception:
+                    pass
             return None
-        
-        if result['error']:
+        except Exception as e:
             # Handle errors
-            error_str = str(result['error']).lower()
+            error_str = str(e).lower()
             if "validation error" in error_str and "tools" in error_str:
                 print(f"ℹ️  {server_name}: No tools available")
             elif "connection" in error_str or "timeout" in error_str:
                 print(f"ℹ️  {server_name}: Connection unavailable")
             else:
-                print(f"ℹ️  {server_name}: Tools unavailable ({result['error']})")
+                print(f"ℹ️  {server_name}: Tools unavailable ({e})")
             return []
-        
+
         # Process successful response
-        tools = result['tools']
         return self._process_tools_response(tools, server_name)
     
     def _process_tools_response(self, tools, server_name: str):
@@ -272,6 +508,51 @@ class AWSMCPManager:
     def _get_tools_from_client(self, client, server_name: str):
         """Get tools from an MCP client (legacy method for compatibility)."""
         return self._get_tools_from_client_with_timeout(client, server_name)
+
+    @staticmethod
+    def _tools_cache_path(server_name: str, server_config: dict) -> str:
+        """Cache file path keyed by server name plus its command line."""
+        import hashlib
+        key = f"{server_name}:{server_config.get('command', '')}:{' '.join(server_config.get('args', []))}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return os.path.join(_TOOLS_CACHE_DIR, f"{digest}.json")
+
+    def _write_tools_metadata_cache(self, server_name: str, server_config: dict, tools: list):
+        """Persist tool metadata (name/description) for warm-start listings.
+
+        Live tool objects hold stdio sessions and cannot be reused across
+        processes, so only their metadata is cached.
+        """
+        try:
+            metadata = [
+                {
+                    'name': str(getattr(tool, '_original_name', None) or getattr(tool, 'name', 'unknown')),
+                    'description': str(getattr(tool, 'description', '') or ''),
+                    'server': server_name,
+                }
+                for tool in tools
+            ]
+            os.makedirs(_TOOLS_CACHE_DIR, exist_ok=True)
+            path = self._tools_cache_path(server_name, server_config)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(metadata, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"ℹ️  Could not cache tool metadata for {server_name}: {e}")
+
+    def load_cached_tools_metadata(self, server_name: str, server_config: dict) -> list | None:
+        """Load cached tool metadata for a server, or None if stale/missing."""
+        try:
+            path = self._tools_cache_path(server_name, server_config)
+            if not os.path.exists(path):
+                return None
+            if time.time() - os.path.getmtime(path) > _TOOLS_CACHE_TTL:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
     
     def get_all_aws_tools(self):
         """Get all tools from AWS MCP clients."""
@@ -283,73 +564,61 @@ class AWSMCPManager:
             return  # Already cleaned up
         
         self._cleanup_registered = True
+
+        if self.session_pool is not None and AgentConfig.MCP_SESSION_POOL:
+            # Pooled clients stay warm for the next invocation; the pool's
+            # atexit hook stops them at process exit.
+            print(f"♻️  Releasing {len(self.mcp_clients)} MCP clients back to session pool...")
+            for server_name in self.mcp_clients:
+                self.session_pool.release(server_name)
+            self.mcp_clients.clear()
+            self.mcp_tools.clear()
+            return
+
         print(f"🧹 Cleaning up {len(self.mcp_clients)} MCP clients...")
-        
-        import time
-        import threading
-        
-        def cleanup_client_with_timeout(server_name, client, timeout=2.0):
-            """Cleanup a single client with timeout."""
-            def cleanup_worker():
+
+        entries = list(self.mcp_clients.items())
+        servers = self.load_aws_mcp_config() or {}
+
+        # First pass: SIGTERM every stdio subprocess (terminate is async, so
+        # all servers shut down in parallel instead of one 2 s join each)
+        for server_name, entry in entries:
+            process = entry.process
+            if process is not None and hasattr(process, 'poll') and process.poll() is None:
                 try:
-                    print(f"   • Stopping {server_name}...")
-                    
-                    # For stdio clients, try to terminate the underlying process first
-                    process = None
-                    try:
-                        if hasattr(client, '_client_session') and hasattr(client._client_session, '_process'):
-                            process = client._client_session._process
-                        elif hasattr(client, '_session') and hasattr(client._session, '_process'):
-                            process = client._session._process
-                        elif hasattr(client, '_process'):
-                            process = client._process
-                        
-                        if process and hasattr(process, 'poll') and process.poll() is None:
-                            print(f"   🔄 Terminating stdio process for {server_name}...")
-                            process.terminate()
-                            time.sleep(0.1)  # Very brief wait
-                            if process.poll() is None:
-                                process.kill()
-                            print(f"   ✅ {server_name} stdio process terminated")
-                        elif process:
-                            print(f"   ℹ️  {server_name} process already terminated")
-                    except Exception as process_error:
-                        print(f"   ⚠️  Process termination failed for {server_name}: {process_error}")
-                    
-                    # Try client cleanup methods (but don't wait long)
+                    print(f"   🔄 Terminating stdio process for {server_name}...")
+                    process.terminate()
+                except Exception as process_error:
+                    print(f"   ⚠️  Process termination failed for {server_name}: {process_error}")
+
+        # Second pass: brief grace period, SIGKILL stragglers, then direct
+        # stop call resolved at registration time
+        for server_name, entry in entries:
+            process = entry.process
+            if process is not None and hasattr(process, 'wait'):
+                try:
+                    process.wait(timeout=self._shutdown_timeout(servers.get(server_name, {})))
+                except Exception:
                     try:
-                        if hasattr(client, 'stop'):
-                            client.stop(None, None, None)
-                        elif hasattr(client, '__exit__'):
-                            client.__exit__(None, None, None)
-                        elif hasattr(client, 'close'):
-                            client.close()
-                        print(f"   ✅ {server_name} stopped successfully")
-                    except Exception as cleanup_error:
-                        print(f"   ⚠️  Client cleanup failed for {server_name}: {cleanup_error}")
-                            
-                except Exception as e:
-                    print(f"   ❌ Complete cleanup failed for {server_name}: {e}")
-            
-            # Run cleanup in a thread with timeout
-            cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-            cleanup_thread.start()
-            cleanup_thread.join(timeout=timeout)
-            
-            if cleanup_thread.is_alive():
-                print(f"   ⚠️  {server_name} cleanup timed out after {timeout}s")
-                return False
-            return True
-        
-        # Cleanup each client with timeout
-        for server_name, client in list(self.mcp_clients.items()):
-            cleanup_client_with_timeout(server_name, client)
-        
+                        process.kill()
+                    except Exception:
+                        pass
+
+            if entry.stop is not None:
+                try:
+                    entry.stop()
+                    print(f"   ✅ {server_name} stopped successfully")
+                except Exception as cleanup_error:
+                    print(f"   ⚠️  Client cleanup failed for {server_name}: {cleanup_error}")
+
         # Clear the clients dictionary
         self.mcp_clients.clear()
         self.mcp_tools.clear()
         print("✅ MCP cleanup completed")
 
+# Shared pool so repeated AWSMCPManager initializations reuse live MCP clients
+_mcp_session_pool = MCPSessionPool()
+
 class AgentConfig:
     """Configuration settings for the EKS Agent."""
     
@@ -363,15 +632,32 @@ class AgentConfig:
     # AWS MCP Configuration
     ENABLE_AWS_MCP = True  # Toggle to enable/disable comprehensive AWS MCP integration
     AWS_MCP_CONFIG_PATH = '/home/ubuntu/agentcore-telco/awslabs-mcp-lambda/mcp/mcp.json'  # Path to AWS MCP config file
-    
-    # Available Models
-    AVAILABLE_MODELS = {
+    MCP_SESSION_POOL = True  # Reuse started MCP clients across agent invocations within the process
+
+    # MCP timeout knobs (seconds). Per-server `initTimeout`/`shutdownTimeout`
+    # entries in mcp.json override these; env vars of the same name override
+    # the class defaults for a whole run.
+    MCP_INIT_TIMEOUT = 5.0        # Wait for a server's init worker (env: MCP_INIT_TIMEOUT)
+    MCP_SHUTDOWN_TIMEOUT = 2.0    # Wait for a server's cleanup worker (env: MCP_SHUTDOWN_TIMEOUT)
+    MCP_TOOL_LIST_TIMEOUT = 10.0  # Wait for list_tools_sync (env: MCP_TOOL_LIST_TIMEOUT)
+    
+    # Available Models (immutable mappings built once at import, so callers
+    # that enumerate models do not pay dict-construction cost per call)
+    AVAILABLE_MODELS = types.MappingProxyType({
         'claude-sonnet-4': 'us.anthropic.claude-sonnet-4-20250514-v1:0',
         'claude-3-7-sonnet': 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
         'claude-3-5-sonnet-v2': 'us.anthropic.claude-3-5-sonnet-20241022-v2:0',
         'claude-3-5-sonnet-v1': 'us.anthropic.claude-3-5-sonnet-20240620-v1:0',
         'claude-3-5-haiku': 'us.anthropic.claude-3-5-haiku-20241022-v1:0'
-    }
+    })
+
+    MODEL_DESCRIPTIONS = types.MappingProxyType({
+        'claude-sonnet-4': 'Claude Sonnet 4 (Latest, Most Capable)',
+        'claude-3-7-sonnet': 'Claude 3.7 Sonnet (Enhanced Reasoning)',
+        'claude-3-5-sonnet-v2': 'Claude 3.5 Sonnet v2 (Balanced Performance)',
+        'claude-3-5-sonnet-v1': 'Claude 3.5 Sonnet v1 (Stable)',
+        'claude-3-5-haiku': 'Claude 3.5 Haiku (Fast & Efficient)'
+    })
     
     # Default model selection
     SELECTED_MODEL = 'claude-3-5-haiku'
@@ -392,13 +678,7 @@ class AgentConfig:
     @classmethod
     def list_models(cls):
         """List available models with descriptions."""
-        return {
-            'claude-sonnet-4': 'Claude Sonnet 4 (Latest, Most Capable)',
-            'claude-3-7-sonnet': 'Claude 3.7 Sonnet (Enhanced Reasoning)',
-            'claude-3-5-sonnet-v2': 'Claude 3.5 Sonnet v2 (Balanced Performance)',
-            'claude-3-5-sonnet-v1': 'Claude 3.5 Sonnet v1 (Stable)',
-            'claude-3-5-haiku': 'Claude 3.5 Haiku (Fast & Efficient)'
-        }
+        return cls.MODEL_DESCRIPTIONS
     
     # Model Settings
     MODEL_TEMPERATURE = 0.3  # Controls randomness in responses (0.3 is fairly deterministic, good for consistent outputs)
@@ -410,13 +690,15 @@ class AgentConfig:
     SSM_MEMORY_ID_PATH = "/app/eksagent/agentcore/memory_id"
     MEMORY_EXPIRY_DAYS = 90
     CONTEXT_RETRIEVAL_TOP_K = 3
+    CONTEXT_RETRIEVAL_TIMEOUT = 10.0  # Wall-clock budget for per-turn retrieval (seconds)
     DEVOPS_USER_ID = "eks_001"
     
     # Search Settings
     SEARCH_REGION = "us-en"
     
-    # System Prompt
-    EKS_SYSTEM_PROMPT = """You are an AWS EKS (Elastic Kubernetes Service) specialist agent. You help with EKS cluster management, Kubernetes operations, containerized applications, and cloud-native solutions.
+    # System Prompt (interned: defined once, shared by identity everywhere
+    # it is attached to a conversation)
+    EKS_SYSTEM_PROMPT = sys.intern("""You are an AWS EKS (Elastic Kubernetes Service) specialist agent. You help with EKS cluster management, Kubernetes operations, containerized applications, and cloud-native solutions.
 
 EXPERTISE AREAS:
 - EKS cluster creation, configuration, and management
@@ -455,8 +737,8 @@ NON-FUNCTIONAL RULES:
 - Be friendly, patient, and understanding with users
 - Always offer additional help after answering questions
 - If you can't help with something, direct users to the appropriate contact
-"""
-    
+""")
+
     @classmethod
     def setup_aws_region(cls):
         """Setup AWS region configuration."""
@@ -465,6 +747,7 @@ NON-FUNCTIONAL RULES:
         os.environ['AWS_REGION'] = cls.DEFAULT_REGION
         
         # Create a new session to ensure region is properly set
+        from boto3.session import Session
         session = Session()
         actual_region = session.region_name or cls.DEFAULT_REGION
         
@@ -485,14 +768,13 @@ NON-FUNCTIONAL RULES:
             return None
             
         try:
-            if not os.path.exists(cls.MCP_CONFIG_PATH):
-                print(f"⚠️  MCP config file not found")
-                return None
-                
-            with open(cls.MCP_CONFIG_PATH, 'r') as f:
-                mcp_config = json.load(f)
-                return mcp_config
-                
+            # _load_json_config_cached stats the file itself; a separate
+            # exists() would just double the syscall
+            return _load_json_config_cached(cls.MCP_CONFIG_PATH)
+
+        except FileNotFoundError:
+            print(f"⚠️  MCP config file not found")
+            return None
         except json.JSONDecodeError as e:
             print(f"❌ Invalid JSON in MCP config file: {e}")
             return None
@@ -500,21 +782,32 @@ NON-FUNCTIONAL RULES:
             print(f"❌ Error loading MCP config: {e}")
             return None
     
+    # Last (config object, servers) pair; load_mcp_config returns the same
+    # cached dict while the file is unchanged, so identity comparison suffices
+    _mcp_servers_cache = None
+
     @classmethod
     def get_mcp_servers(cls):
         """Get MCP servers configuration."""
         mcp_config = cls.load_mcp_config()
-        if mcp_config and 'mcpServers' in mcp_config:
-            return mcp_config['mcpServers']
-        return {}
+        cached = cls._mcp_servers_cache
+        if cached is not None and cached[0] is mcp_config:
+            return cached[1]
+
+        servers = mcp_config['mcpServers'] if mcp_config and 'mcpServers' in mcp_config else {}
+        cls._mcp_servers_cache = (mcp_config, servers)
+        return servers
     
     @classmethod
     def is_mcp_server_enabled(cls, server_name: str):
         """Check if a specific MCP server is enabled."""
-        servers = cls.get_mcp_servers()
-        if server_name in servers:
-            return not servers[server_name].get('disabled', False)
-        return False
+        global _ENABLED_SERVERS
+        if _ENABLED_SERVERS is None:
+            _ENABLED_SERVERS = frozenset(
+                name for name, config in cls.get_mcp_servers().items()
+                if not config.get('disabled', False)
+            )
+        return server_name in _ENABLED_SERVERS
     
     @classmethod
     def toggle_mcp_config(cls, enabled: bool = None):
@@ -535,10 +828,10 @@ def select_model_interactive():
     models = AgentConfig.list_models()
     model_keys = list(models.keys())
     
-    for i, (key, description) in enumerate(models.items(), 1):
-        current = " (CURRENT)" if key == AgentConfig.SELECTED_MODEL else ""
-        print(f"{i}. {description}{current}")
-    
+    print("\n".join(
+        f"{i}. {description}{' (CURRENT)' if key == AgentConfig.SELECTED_MODEL else ''}"
+        for i, (key, description) in enumerate(models.items(), 1)
+    ))
     print(f"\n0. Use current selection: {models[AgentConfig.SELECTED_MODEL]}")
     
     try:
@@ -564,11 +857,15 @@ def handle_command_line_args():
         if sys.argv[1] == '--select-model':
             select_model_interactive()
             sys.exit(0)
+        elif sys.argv[1] == '--refresh-tools':
+            refresh_tools_cache()
+            sys.exit(0)
         elif sys.argv[1] in ['--help', '-h']:
             print("\n🤖 AWS EKS Agent - Usage")
             print("=" * 40)
             print("python3 agent.py                 # Run agent with current model")
             print("python3 agent.py --select-model  # Interactive model selection")
+            print("python3 agent.py --refresh-tools # Clear cached MCP tool metadata")
             print("python3 select_model.py          # Standalone model selector")
             print("\nAvailable Models:")
             for key, desc in AgentConfig.list_models().items():
@@ -592,15 +889,44 @@ aws_mcp_manager = None
 memory_id = None
 memory_client = None
 
+# Pooled HTTP session shared by discovery-URL checks and Cognito token
+# refreshes, so warm calls reuse one keep-alive TLS connection instead of
+# paying a fresh TCP + TLS handshake each time. Built lazily so importing
+# this module does not pull in requests.
+_HTTP = None
+
+def _http_session():
+    """Return the shared pooled HTTP session, creating it on first use."""
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _HTTP = requests.Session()
+        _HTTP.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2,
+                              status_forcelist=[429, 502, 503, 504]),
+        ))
+    return _HTTP
+
+# Memoize successful validations so repeat checks within a run skip the network
+_DISCOVERY_CACHE: dict[str, tuple[float, bool, str]] = {}
+_DISCOVERY_CACHE_TTL = 300.0  # seconds
+
 def validate_discovery_url(url):
     """Validate that the discovery URL is accessible and returns valid OIDC configuration."""
+    cached = _DISCOVERY_CACHE.get(url)
+    if cached and time.time() - cached[0] < _DISCOVERY_CACHE_TTL:
+        return cached[1], cached[2]
+
     try:
-        import requests
-        response = requests.get(url, timeout=10)
+        response = _http_session().get(url, timeout=10)
         if response.status_code == 200:
-            config = response.json()
+            config = _json_loads(response.content)
             required_fields = ['issuer', 'authorization_endpoint', 'token_endpoint', 'jwks_uri']
             if all(field in config for field in required_fields):
+                _DISCOVERY_CACHE[url] = (time.time(), True, "Valid OIDC configuration")
                 return True, "Valid OIDC configuration"
             else:
                 return False, f"Missing required OIDC fields: {[f for f in required_fields if f not in config]}"
@@ -664,7 +990,7 @@ def use_manual_gateway(region=None):
     if region is None:
         region = globals().get('REGION', 'us-east-1')
     
-    gateway_client = boto3.client("bedrock-agentcore-control", region_name=region)
+    gateway_client = _boto_client("bedrock-agentcore-control", region)
     
     try:
         # Get gateway details
@@ -699,7 +1025,7 @@ def use_manual_gateway(region=None):
 #         print("   Gateway is only needed for advanced MCP integrations")
 #         return None, None
 #     
-#     gateway_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
+#     gateway_client = _boto_client("bedrock-agentcore-control", REGION)
 #     gateway_name = "eksagent-agentcore-gw"
 #     
 #     # Get configuration
@@ -765,7 +1091,15 @@ def try_existing_gateway(gateway_client):
 # Gateway initialization will be done in main()
 
 # Using the AgentCore Gateway for MCP server (only if gateway is available)
+# Cognito client_credentials tokens stay valid for a full hour; cache them
+# keyed by (client_id, scope) and refresh 60 s before expiry. The lock keeps
+# concurrent callers from stampeding Cognito for the same token.
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[float, dict]] = {}
+_TOKEN_LOCK = threading.Lock()
+
 def get_token(client_id: str, client_secret: str, scope_string: str = None, url: str = None) -> dict:
+    import requests
+
     try:
         # Use default values if not provided
         if scope_string is None:
@@ -775,18 +1109,37 @@ def get_token(client_id: str, client_secret: str, scope_string: str = None, url:
             if not url or "REDACTED_COGNITO_ID" in url:
                 # Skip token request if no valid URL is configured
                 return {"error": "Cognito token URL not configured. Please set /app/eksagent/agentcore/cognito_token_url SSM parameter."}
-            
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "scope": scope_string,
 
-        }
-        response = requests.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # Include the endpoint so tokens from different user pools never collide
+        cache_key = (client_id, scope_string, url)
+        with _TOKEN_LOCK:
+            cached = _TOKEN_CACHE.get(cache_key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+            headers = {"Content-Type": "application/x-www-form-urlencoded"}
+            data = {
+                "grant_type": "client_credentials",
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "scope": scope_string,
+
+            }
+            # (connect, read) timeout so a stalled Cognito endpoint cannot
+            # hang the agent
+            response = _http_session().post(url, headers=headers, data=data,
+                                            timeout=(3.05, 10))
+            response.raise_for_status()
+            token = _json_loads(response.content)
+
+            expires_in = token.get('expires_in')
+            if 'access_token' in token and expires_in:
+                # Refresh at ~75% of the token lifetime (at least 60s early)
+                # so a token never expires mid-request
+                lifetime = float(expires_in)
+                margin = max(60.0, 0.25 * lifetime)
+                _TOKEN_CACHE[cache_key] = (time.monotonic() + lifetime - margin, token)
+            return token
 
     except requests.exceptions.RequestException as err:
         return {"error": str(err)}
@@ -798,56 +1151,82 @@ def get_token(client_id: str, client_secret: str, scope_string: str = None, url:
 # Global cleanup state
 _cleanup_done = False
 
+# Single cached worker so shutdown does not pay thread creation per cleanup
+_cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cleanup')
+
 # Define cleanup functions
 def cleanup_all_resources():
     """Cleanup all MCP resources and connections with timeout."""
     global _cleanup_done
-    
+
     if _cleanup_done:
         return  # Already cleaned up
-    
+
     _cleanup_done = True
+
+    # Give queued memory writes a chance to land before anything is torn
+    # down (main() force-exits, which would skip the atexit flush)
+    _flush_memory_saves()
+
+    if not aws_mcp_manager and not mcp_client and not _mcp_session_pool._entries:
+        # Nothing connected and nothing pooled - skip the worker entirely
+        _stop_log_listener()
+        return
+
     print("\n🧹 Cleaning up resources...")
-    
-    import threading
-    import time
-    import os
-    
+
     def cleanup_with_timeout():
         """Perform cleanup operations."""
+        # Buffer progress lines into one stdout write; error paths still
+        # print immediately so they are flushed before a possible hang
+        msgs = []
         try:
             # Cleanup AWS MCP clients
             if aws_mcp_manager:
-                print("🔄 Cleaning up AWS MCP clients...")
+                msgs.append("🔄 Cleaning up AWS MCP clients...")
                 aws_mcp_manager.cleanup()
-            
+
             # Cleanup main MCP client (gateway connection)
             if mcp_client:
                 try:
-                    print("🔄 Cleaning up main MCP client...")
+                    msgs.append("🔄 Cleaning up main MCP client...")
                     if hasattr(mcp_client, 'stop'):
                         mcp_client.stop(None, None, None)
                     elif hasattr(mcp_client, '__exit__'):
                         mcp_client.__exit__(None, None, None)
                     elif hasattr(mcp_client, 'close'):
                         mcp_client.close()
-                    print("✅ Main MCP client cleanup completed")
+                    msgs.append("✅ Main MCP client cleanup completed")
                 except Exception as e:
                     print(f"⚠️  Main MCP client cleanup failed: {e}")
+
+            # Stop pooled clients here rather than relying on the pool's
+            # atexit hook: both exit paths end in os._exit(0), which skips
+            # atexit handlers and would leave stdio child processes running
+            msgs.append("🔄 Stopping pooled MCP clients...")
+            _mcp_session_pool.close_all()
         except Exception as e:
             print(f"⚠️  Cleanup error: {e}")
+        finally:
+            if msgs:
+                sys.stdout.write("\n".join(msgs) + "\n")
+                sys.stdout.flush()
     
     # Run cleanup with timeout to prevent hanging
-    cleanup_thread = threading.Thread(target=cleanup_with_timeout, daemon=True)
-    cleanup_thread.start()
-    cleanup_thread.join(timeout=3.0)  # 3 second timeout
-    
-    if cleanup_thread.is_alive():
+    future = _cleanup_executor.submit(cleanup_with_timeout)
+    try:
+        future.result(timeout=3.0)  # 3 second timeout
+    except FutureTimeoutError:
+        # Flush any queued log records before we go quiet
+        _stop_log_listener()
         print("⚠️  Cleanup timed out, forcing exit...")
-        # Force exit if cleanup hangs
+        # os._exit skips atexit, so pooled stdio children must be killed
+        # directly before the forced exit or they outlive the process
+        _mcp_session_pool.kill_all_processes()
         os._exit(0)
-    else:
-        print("✅ All resources cleaned up")
+
+    _stop_log_listener()
+    print("✅ All resources cleaned up")
 
 def emergency_cleanup():
     """Emergency cleanup function for unexpected exits."""
@@ -859,20 +1238,45 @@ def emergency_cleanup():
 # Note: atexit cleanup removed to prevent double cleanup
 # Cleanup is handled by the main() function's finally block
 
-# Configure logging to reduce verbose output
-logging.getLogger("strands").setLevel(logging.WARNING)  # Reduce strands logging to prevent duplicate output
-logging.getLogger("mcp").setLevel(logging.WARNING)  # Reduce MCP logging
-logging.getLogger("httpx").setLevel(logging.WARNING)  # Reduce HTTP request logging
-logging.getLogger("awslabs.prometheus_mcp_server").setLevel(logging.WARNING)  # Reduce Prometheus MCP server logging
-logging.getLogger("awslabs.cloudwatch_mcp_server").setLevel(logging.WARNING)  # Reduce CloudWatch MCP server logging
-logging.getLogger("awslabs.eks_mcp_server").setLevel(logging.WARNING)  # Reduce EKS MCP server logging
-logging.getLogger("boto3").setLevel(logging.WARNING)  # Reduce boto3 logging
-logging.getLogger("botocore").setLevel(logging.WARNING)  # Reduce botocore logging
-logging.getLogger("urllib3").setLevel(logging.WARNING)  # Reduce urllib3 logging
+# Configure logging to reduce verbose output from noisy third-party loggers
+_QUIET_LOGGERS = (
+    "strands",  # prevent duplicate output
+    "mcp",
+    "httpx",
+    "awslabs.prometheus_mcp_server",
+    "awslabs.cloudwatch_mcp_server",
+    "awslabs.eks_mcp_server",
+    "boto3",
+    "botocore",
+    "urllib3",
+)
+for _name in _QUIET_LOGGERS:
+    logging.getLogger(_name).setLevel(logging.WARNING)
 
 # Set root logger to WARNING to catch any other verbose loggers
 logging.getLogger().setLevel(logging.WARNING)
 
+# Route log records through a queue so emitting never blocks the calling
+# thread on stderr I/O; a single background listener does the actual writes.
+# Strands tool calls run on the agent's event thread, so this keeps logging
+# off the hot path.
+import logging.handlers
+import queue
+
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(), respect_handler_level=True
+)
+_log_listener.start()
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread."""
+    try:
+        _log_listener.stop()
+    except Exception:
+        pass
+
 logger = logging.getLogger(__name__)
 
 
@@ -895,24 +1299,25 @@ def manage_mcp_config(action: str = "status", server_name: str = None) -> str:
         config_path = AgentConfig.MCP_CONFIG_PATH
         config_exists = os.path.exists(config_path)
         
-        result = f"🔧 **MCP Configuration Status:**\n\n"
-        result += f"• AgentCore Gateway: {'🟢 Connected' if mcp_client else '🔴 Disconnected'}\n"
-        result += f"• AWS MCP Integration: {'🟢 Active' if aws_mcp_manager else '🔴 Inactive'}\n"
-        result += f"• AWS MCP Integration: {aws_mcp_status}\n"
-        result += f"• Config File Path: {config_path}\n"
-        result += f"• Config File Exists: {'✅ Yes' if config_exists else '❌ No'}\n"
+        parts = [f"🔧 **MCP Configuration Status:**\n\n"]
+        parts.append(f"• AgentCore Gateway: {'🟢 Connected' if mcp_client else '🔴 Disconnected'}\n")
+        parts.append(f"• AWS MCP Integration: {'🟢 Active' if aws_mcp_manager else '🔴 Inactive'}\n")
+        parts.append(f"• AWS MCP Integration: {aws_mcp_status}\n")
+        parts.append(f"• Config File Path: {config_path}\n")
+        parts.append(f"• Config File Exists: {'✅ Yes' if config_exists else '❌ No'}\n")
         
         if config_exists and AgentConfig.ENABLE_AWS_MCP:
             servers = AgentConfig.get_mcp_servers()
-            enabled_count = sum(1 for s in servers.values() if not s.get('disabled', False))
-            result += f"• Total MCP Servers: {len(servers)}\n"
-            result += f"• Enabled Servers: {enabled_count}\n"
+            if servers:
+                enabled_count = sum(1 for s in servers.values() if not s.get('disabled', False))
+                parts.append(f"• Total MCP Servers: {len(servers)}\n")
+                parts.append(f"• Enabled Servers: {enabled_count}\n")
         
         if aws_mcp_manager:
             aws_tools_count = len(aws_mcp_manager.get_all_aws_tools())
-            result += f"• AWS MCP Tools Available: {aws_tools_count}\n"
+            parts.append(f"• AWS MCP Tools Available: {aws_tools_count}\n")
         
-        return result
+        return "".join(parts)
     
     elif action == "aws_status":
         if not aws_mcp_manager:
@@ -921,20 +1326,20 @@ def manage_mcp_config(action: str = "status", server_name: str = None) -> str:
         aws_tools = aws_mcp_manager.get_all_aws_tools()
         active_clients = len(aws_mcp_manager.mcp_clients)
         
-        result = f"🔧 **AWS MCP Integration Status:**\n\n"
-        result += f"• Status: 🟢 Active\n"
-        result += f"• Active Clients: {active_clients}\n"
-        result += f"• Available Tools: {len(aws_tools)}\n"
-        result += f"• Config Path: {AgentConfig.AWS_MCP_CONFIG_PATH}\n\n"
+        parts = [f"🔧 **AWS MCP Integration Status:**\n\n"]
+        parts.append(f"• Status: 🟢 Active\n")
+        parts.append(f"• Active Clients: {active_clients}\n")
+        parts.append(f"• Available Tools: {len(aws_tools)}\n")
+        parts.append(f"• Config Path: {AgentConfig.AWS_MCP_CONFIG_PATH}\n\n")
         
         if active_clients > 0:
-            result += "**Active Servers:**\n"
+            parts.append("**Active Servers:**\n")
             for server_name in aws_mcp_manager.mcp_clients.keys():
                 clean_name = server_name.replace('awslabs.', '').replace('-mcp-server', '')
                 server_tools = [t for t in aws_tools if getattr(t, '_server_name', '') == server_name]
-                result += f"• {clean_name}: {len(server_tools)} tools\n"
+                parts.append(f"• {clean_name}: {len(server_tools)} tools\n")
         
-        return result
+        return "".join(parts)
     
     elif action == "enable":
         AgentConfig.ENABLE_AWS_MCP = True
@@ -952,15 +1357,15 @@ def manage_mcp_config(action: str = "status", server_name: str = None) -> str:
         if not servers:
             return "ℹ️  No MCP servers found in configuration"
         
-        result = f"🔧 **MCP Servers ({len(servers)} total):**\n\n"
+        parts = [f"🔧 **MCP Servers ({len(servers)} total):**\n\n"]
         for name, config in servers.items():
             status = "🟢 Enabled" if not config.get('disabled', False) else "🔴 Disabled"
             command = config.get('command', 'Unknown')
             args = config.get('args', [])
-            result += f"• **{name}**: {status}\n"
-            result += f"  Command: {command} {' '.join(args)}\n\n"
+            parts.append(f"• **{name}**: {status}\n")
+            parts.append(f"  Command: {command} {' '.join(args)}\n\n")
         
-        return result
+        return "".join(parts)
     
     elif action == "server_status":
         if not server_name:
@@ -976,22 +1381,22 @@ def manage_mcp_config(action: str = "status", server_name: str = None) -> str:
         server_config = servers[server_name]
         enabled = not server_config.get('disabled', False)
         
-        result = f"🔧 **MCP Server: {server_name}**\n\n"
-        result += f"• Status: {'🟢 Enabled' if enabled else '🔴 Disabled'}\n"
-        result += f"• Command: {server_config.get('command', 'Unknown')}\n"
-        result += f"• Args: {' '.join(server_config.get('args', []))}\n"
+        parts = [f"🔧 **MCP Server: {server_name}**\n\n"]
+        parts.append(f"• Status: {'🟢 Enabled' if enabled else '🔴 Disabled'}\n")
+        parts.append(f"• Command: {server_config.get('command', 'Unknown')}\n")
+        parts.append(f"• Args: {' '.join(server_config.get('args', []))}\n")
         
         env_vars = server_config.get('env', {})
         if env_vars:
-            result += f"• Environment Variables:\n"
+            parts.append(f"• Environment Variables:\n")
             for key, value in env_vars.items():
-                result += f"  - {key}: {value}\n"
+                parts.append(f"  - {key}: {value}\n")
         
         auto_approve = server_config.get('autoApprove', [])
         if auto_approve:
-            result += f"• Auto-approved Tools: {', '.join(auto_approve)}\n"
+            parts.append(f"• Auto-approved Tools: {', '.join(auto_approve)}\n")
         
-        return result
+        return "".join(parts)
     
     else:
         return f"❌ Unknown action: {action}. Available actions: status, enable, disable, list_servers, server_status, aws_status"
@@ -1014,7 +1419,7 @@ def list_agentcore_gateway_tools() -> str:
         if not mcp_tools:
             return "ℹ️  No AgentCore Gateway MCP tools are currently available."
         
-        result = f"🛠️  **AgentCore Gateway MCP Tools ({len(mcp_tools)} total):**\n\n"
+        parts = [f"🛠️  **AgentCore Gateway MCP Tools ({len(mcp_tools)} total):**\n\n"]
         
         for i, tool in enumerate(mcp_tools, 1):
             # Try multiple ways to get tool name
@@ -1024,54 +1429,53 @@ def list_agentcore_gateway_tools() -> str:
             # Debug: Let's see what attributes the tool object has
             tool_attrs = [attr for attr in dir(tool) if not attr.startswith('_')]
             
-            # Try different attribute names for tool name
-            for name_attr in ['name', 'tool_name', 'function_name', '__name__']:
-                if hasattr(tool, name_attr):
-                    name_value = getattr(tool, name_attr)
-                    if name_value and str(name_value) != 'Unknown':
-                        tool_name = str(name_value)
-                        break
-            
+            # Try different attribute names for tool name; single getattr per
+            # candidate instead of a hasattr/getattr pair
+            for name_attr in ('name', 'tool_name', 'function_name', '__name__'):
+                name_value = getattr(tool, name_attr, None)
+                if name_value and str(name_value) != 'Unknown':
+                    tool_name = str(name_value)
+                    break
+
             # Try different attribute names for description
-            for desc_attr in ['description', 'doc', '__doc__', 'help_text']:
-                if hasattr(tool, desc_attr):
-                    desc_value = getattr(tool, desc_attr)
-                    if desc_value and str(desc_value) != 'No description available':
-                        tool_description = str(desc_value)
-                        break
-            
+            for desc_attr in ('description', 'doc', '__doc__', 'help_text'):
+                desc_value = getattr(tool, desc_attr, None)
+                if desc_value and str(desc_value) != 'No description available':
+                    tool_description = str(desc_value)
+                    break
+
             # Try to get tool info from _tool_info if it exists (common in MCP tools)
-            if hasattr(tool, '_tool_info'):
-                tool_info = tool._tool_info
-                if hasattr(tool_info, 'name') and tool_info.name:
-                    tool_name = tool_info.name
-                if hasattr(tool_info, 'description') and tool_info.description:
-                    tool_description = tool_info.description
-            
+            tool_info = getattr(tool, '_tool_info', None)
+            if tool_info is not None:
+                info_name = getattr(tool_info, 'name', None)
+                if info_name:
+                    tool_name = info_name
+                info_description = getattr(tool_info, 'description', None)
+                if info_description:
+                    tool_description = info_description
+
             # Get input schema details
             input_schema = None
             parameters_info = ""
-            
+
             # Try different ways to get input schema
-            for schema_attr in ['inputSchema', 'input_schema', 'schema', 'parameters']:
-                if hasattr(tool, schema_attr):
-                    input_schema = getattr(tool, schema_attr)
+            for schema_attr in ('inputSchema', 'input_schema', 'schema', 'parameters'):
+                input_schema = getattr(tool, schema_attr, None)
+                if input_schema is not None:
                     break
-            
+
             # Also try from _tool_info
-            if not input_schema and hasattr(tool, '_tool_info') and hasattr(tool._tool_info, 'inputSchema'):
-                input_schema = tool._tool_info.inputSchema
+            if not input_schema and tool_info is not None:
+                input_schema = getattr(tool_info, 'inputSchema', None)
             
             if input_schema:
                 param_details = []
                 
-                # Handle different schema formats
-                properties = None
-                if hasattr(input_schema, 'properties'):
-                    properties = input_schema.properties
-                elif isinstance(input_schema, dict) and 'properties' in input_schema:
-                    properties = input_schema['properties']
-                
+                # Handle different schema formats with a single lookup each
+                properties = getattr(input_schema, 'properties', None)
+                if properties is None and isinstance(input_schema, dict):
+                    properties = input_schema.get('properties')
+
                 if properties:
                     for param_name, param_info in properties.items():
                         if isinstance(param_info, dict):
@@ -1091,12 +1495,12 @@ def list_agentcore_gateway_tools() -> str:
             if i <= 3:  # Only show for first 3 tools to avoid spam
                 debug_info = f"\n  [Debug - Available attributes: {', '.join(tool_attrs[:10])}{'...' if len(tool_attrs) > 10 else ''}]"
             
-            result += f"{i:2d}. **{tool_name}**\n"
-            result += f"    Description: {tool_description}{parameters_info}{debug_info}\n\n"
+            parts.append(f"{i:2d}. **{tool_name}**\n")
+            parts.append(f"    Description: {tool_description}{parameters_info}{debug_info}\n\n")
         
-        result += "💡 Use these tools by calling them directly in your queries to the agent.\n"
-        result += "🔗 These tools are provided through the AgentCore Gateway MCP integration."
-        return result
+        parts.append("💡 Use these tools by calling them directly in your queries to the agent.\n")
+        parts.append("🔗 These tools are provided through the AgentCore Gateway MCP integration.")
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error retrieving AgentCore Gateway MCP tools: {str(e)}"
@@ -1113,39 +1517,51 @@ def list_aws_mcp_tools() -> str:
     
     try:
         aws_tools = aws_mcp_manager.get_all_aws_tools()
-        
+
         if not aws_tools:
+            # Fall back to cached metadata from a previous run, if any
+            cached_lines = []
+            for name, config in AgentConfig.get_mcp_servers().items():
+                metadata = aws_mcp_manager.load_cached_tools_metadata(name, config)
+                if metadata:
+                    clean_name = name.replace('awslabs.', '').replace('-mcp-server', '')
+                    cached_lines.append(f"• {clean_name}: {len(metadata)} tools (cached)")
+            if cached_lines:
+                return ("ℹ️  No live AWS MCP tools yet. Cached tool metadata from a previous run:\n"
+                        + "\n".join(cached_lines))
             return "ℹ️  No AWS MCP tools are currently available."
         
-        result = f"🔧 **Available AWS MCP Tools ({len(aws_tools)} total):**\n\n"
+        parts = [f"🔧 **Available AWS MCP Tools ({len(aws_tools)} total):**\n\n"]
         
-        # Group tools by server
-        tools_by_server = {}
+        # Group tools by server in a single pass (one dict op per tool)
+        tools_by_server = defaultdict(list)
         for tool in aws_tools:
-            server_name = getattr(tool, '_server_name', 'Unknown')
-            if server_name not in tools_by_server:
-                tools_by_server[server_name] = []
-            tools_by_server[server_name].append(tool)
-        
+            tools_by_server[getattr(tool, '_server_name', 'Unknown')].append(tool)
+
+        # attrgetter is C-implemented; bind once instead of two getattrs per tool
+        get_meta = operator.attrgetter('name', 'description')
+
         for server_name, tools in tools_by_server.items():
             clean_server_name = server_name.replace('awslabs.', '').replace('-mcp-server', '')
-            result += f"**{clean_server_name.upper()} ({len(tools)} tools):**\n"
-            
+            parts.append(f"**{clean_server_name.upper()} ({len(tools)} tools):**\n")
+
             for i, tool in enumerate(tools, 1):
-                tool_name = getattr(tool, 'name', 'Unknown')
-                tool_description = getattr(tool, 'description', 'No description available')
-                
+                try:
+                    tool_name, tool_description = get_meta(tool)
+                except AttributeError:
+                    tool_name = getattr(tool, 'name', 'Unknown')
+                    tool_description = getattr(tool, 'description', 'No description available')
+
                 # Truncate long descriptions
                 if len(tool_description) > 100:
                     tool_description = tool_description[:97] + "..."
-                
-                result += f"{i:2d}. {tool_name}\n"
-                result += f"    {tool_description}\n"
-            
-            result += "\n"
+
+                parts.append(f"{i:2d}. {tool_name}\n    {tool_description}\n")
+
+            parts.append("\n")
         
-        result += "💡 These tools are available through AWS MCP integration and provide direct access to AWS services."
-        return result
+        parts.append("💡 These tools are available through AWS MCP integration and provide direct access to AWS services.")
+        return "".join(parts)
         
     except Exception as e:
         return f"❌ Error retrieving AWS MCP tools: {str(e)}"
@@ -1164,7 +1580,7 @@ def list_mcp_servers_from_config() -> str:
     if not servers:
         return "ℹ️  No MCP servers found in configuration file."
     
-    result = f"📋 **All MCP Servers from Configuration ({len(servers)} total):**\n\n"
+    parts = [f"📋 **All MCP Servers from Configuration ({len(servers)} total):**\n\n"]
     
     enabled_count = 0
     disabled_count = 0
@@ -1179,8 +1595,8 @@ def list_mcp_servers_from_config() -> str:
         else:
             disabled_count += 1
         
-        result += f"{status_icon} **{name}** ({status_text})\n"
-        result += f"   Command: `{config.get('command', 'Unknown')}`\n"
+        parts.append(f"{status_icon} **{name}** ({status_text})\n")
+        parts.append(f"   Command: `{config.get('command', 'Unknown')}`\n")
         
         args = config.get('args', [])
         if args:
@@ -1188,7 +1604,7 @@ def list_mcp_servers_from_config() -> str:
             # Truncate very long args for readability
             if len(args_str) > 80:
                 args_str = args_str[:77] + "..."
-            result += f"   Args: {args_str}\n"
+            parts.append(f"   Args: {args_str}\n")
         
         env_vars = config.get('env', {})
         if env_vars:
@@ -1196,24 +1612,24 @@ def list_mcp_servers_from_config() -> str:
             env_str = ', '.join(env_list)
             if len(env_str) > 60:
                 env_str = env_str[:57] + "..."
-            result += f"   Environment: {env_str}\n"
+            parts.append(f"   Environment: {env_str}\n")
         
         auto_approve = config.get('autoApprove', [])
         if auto_approve:
             auto_str = ', '.join(auto_approve[:3])
             if len(auto_approve) > 3:
                 auto_str += f" (+{len(auto_approve)-3} more)"
-            result += f"   Auto-approved: {auto_str}\n"
+            parts.append(f"   Auto-approved: {auto_str}\n")
         
-        result += "\n"
+        parts.append("\n")
     
     # Summary
-    result += f"📊 **Summary:**\n"
-    result += f"• Total Servers: {len(servers)}\n"
-    result += f"• Enabled: {enabled_count}\n"
-    result += f"• Disabled: {disabled_count}\n"
+    parts.append(f"📊 **Summary:**\n")
+    parts.append(f"• Total Servers: {len(servers)}\n")
+    parts.append(f"• Enabled: {enabled_count}\n")
+    parts.append(f"• Disabled: {disabled_count}\n")
     
-    return result
+    return "".join(parts)
 
 @tool
 def show_available_mcp_servers() -> str:
@@ -1229,8 +1645,8 @@ def show_available_mcp_servers() -> str:
     if not servers:
         return "ℹ️  No MCP servers found in configuration file."
     
-    result = f"🔧 **MCP Servers from Configuration File ({len(servers)} total):**\n\n"
-    result += f"📁 **Config Path:** {AgentConfig.MCP_CONFIG_PATH}\n\n"
+    parts = [f"🔧 **MCP Servers from Configuration File ({len(servers)} total):**\n\n"]
+    parts.append(f"📁 **Config Path:** {AgentConfig.MCP_CONFIG_PATH}\n\n")
     
     enabled_servers = []
     disabled_servers = []
@@ -1252,34 +1668,34 @@ def show_available_mcp_servers() -> str:
     
     # Show enabled servers first
     if enabled_servers:
-        result += f"🟢 **Enabled Servers ({len(enabled_servers)}):**\n\n"
+        parts.append(f"🟢 **Enabled Servers ({len(enabled_servers)}):**\n\n")
         for server in enabled_servers:
-            result += f"• **{server['name']}**\n"
-            result += f"  Command: `{server['command']} {' '.join(server['args'])}`\n"
+            parts.append(f"• **{server['name']}**\n")
+            parts.append(f"  Command: `{server['command']} {' '.join(server['args'])}`\n")
             
             if server['env']:
                 env_summary = ', '.join([f"{k}={v}" for k, v in list(server['env'].items())[:2]])
                 if len(server['env']) > 2:
                     env_summary += f" (+{len(server['env'])-2} more)"
-                result += f"  Environment: {env_summary}\n"
+                parts.append(f"  Environment: {env_summary}\n")
             
             if server['autoApprove']:
                 auto_approve_summary = ', '.join(server['autoApprove'][:3])
                 if len(server['autoApprove']) > 3:
                     auto_approve_summary += f" (+{len(server['autoApprove'])-3} more)"
-                result += f"  Auto-approved: {auto_approve_summary}\n"
+                parts.append(f"  Auto-approved: {auto_approve_summary}\n")
             
-            result += "\n"
+            parts.append("\n")
     
     # Show disabled servers
     if disabled_servers:
-        result += f"🔴 **Disabled Servers ({len(disabled_servers)}):**\n\n"
+        parts.append(f"🔴 **Disabled Servers ({len(disabled_servers)}):**\n\n")
         for server in disabled_servers:
-            result += f"• **{server['name']}** (disabled)\n"
-            result += f"  Command: `{server['command']} {' '.join(server['args'])}`\n\n"
+            parts.append(f"• **{server['name']}** (disabled)\n")
+            parts.append(f"  Command: `{server['command']} {' '.join(server['args'])}`\n\n")
     
-    result += f"💡 Use `manage_mcp_config(action='server_status', server_name='<name>')` for detailed server info."
-    return result
+    parts.append(f"💡 Use `manage_mcp_config(action='server_status', server_name='<name>')` for detailed server info.")
+    return "".join(parts)
 
 
 
@@ -1287,6 +1703,51 @@ def show_available_mcp_servers() -> str:
 
 
 
+@tool
+def list_eks_clusters() -> str:
+    """List EKS clusters in the current region with status details.
+
+    Returns:
+        Formatted list of EKS clusters with status, version and endpoint
+    """
+    region = REGION or AgentConfig.DEFAULT_REGION
+    try:
+        eks_client = _boto_client('eks', region)
+
+        clusters = []
+        paginator = eks_client.get_paginator('list_clusters')
+        for page in paginator.paginate():
+            clusters.extend(page.get('clusters', []))
+
+        if not clusters:
+            return f"ℹ️  No EKS clusters found in {region}."
+
+        def _safe_describe(name):
+            try:
+                return eks_client.describe_cluster(name=name).get('cluster', {'name': name})
+            except Exception as e:
+                return {'name': name, 'status': f'Error: {e}'}
+
+        # describe_cluster is a ~100 ms round-trip per cluster; fan out so
+        # total latency is one round-trip instead of one per cluster
+        with ThreadPoolExecutor(max_workers=min(16, len(clusters))) as executor:
+            details = list(executor.map(_safe_describe, clusters))
+
+        parts = [f"🔧 **EKS Clusters in {region} ({len(details)} total):**\n\n"]
+        for cluster in details:
+            parts.append(f"• **{cluster.get('name', 'Unknown')}**\n")
+            parts.append(f"  Status: {cluster.get('status', 'Unknown')}\n")
+            if cluster.get('version'):
+                parts.append(f"  Version: {cluster['version']}\n")
+            if cluster.get('endpoint'):
+                parts.append(f"  Endpoint: {cluster['endpoint']}\n")
+            parts.append("\n")
+        return "".join(parts)
+
+    except Exception as e:
+        return f"❌ Error listing EKS clusters: {str(e)}"
+
+
 @tool
 def websearch(
     keywords: str, region: str = AgentConfig.SEARCH_REGION, max_results: int | None = None
@@ -1304,25 +1765,28 @@ def websearch(
     if not keywords or not keywords.strip():
         return "Error: Search keywords cannot be empty."
     
+    from ddgs import DDGS
+    from ddgs.exceptions import DDGSException, RatelimitException
+
     try:
-        logger.info(f"Performing web search for: '{keywords}' in region: {region}")
+        logger.info("Performing web search for: '%s' in region: %s", keywords, region)
         results = DDGS().text(keywords, region=region, max_results=max_results)
         
         if not results:
-            logger.warning(f"No search results found for: {keywords}")
+            logger.warning("No search results found for: %s", keywords)
             return "No results found."
         
-        logger.info(f"Found {len(results)} search results")
+        logger.info("Found %d search results", len(results))
         return _format_search_results(results)
         
     except RatelimitException:
         logger.warning("DuckDuckGo rate limit exceeded")
         return "Rate limit exceeded. Please try again after a short delay."
     except DDGSException as e:
-        logger.error(f"DuckDuckGo search error: {e}")
+        logger.error("DuckDuckGo search error: %s", e)
         return f"Search service error: {e}"
     except Exception as e:
-        logger.error(f"Unexpected error during web search: {e}")
+        logger.error("Unexpected error during web search: %s", e)
         return f"Search failed: {e}"
 
 def _format_search_results(results: list) -> str:
@@ -1330,15 +1794,12 @@ def _format_search_results(results: list) -> str:
     if not results:
         return "No results found."
     
-    formatted = []
-    for i, result in enumerate(results, 1):
-        title = result.get('title', 'No title')
-        body = result.get('body', 'No description')
-        href = result.get('href', 'No URL')
-        
-        formatted.append(f"{i}. **{title}**\n   {body}\n   URL: {href}\n")
-    
-    return "\n".join(formatted)
+    return "\n".join(
+        f"{i}. **{result.get('title', 'No title')}**\n"
+        f"   {result.get('body', 'No description')}\n"
+        f"   URL: {result.get('href', 'No URL')}\n"
+        for i, result in enumerate(results, 1)
+    )
 
 
 # Create a Bedrock model instance with temperature control
@@ -1376,16 +1837,16 @@ class MemoryManager:
         try:
             memory_id = get_ssm_parameter(AgentConfig.SSM_MEMORY_ID_PATH)
             if memory_id:
-                logger.info(f"Found memory ID in SSM: {memory_id}")
+                logger.info("Found memory ID in SSM: %s", memory_id)
                 # Verify the memory exists
                 try:
                     self.client.gmcp_client.get_memory(memoryId=memory_id)
                     logger.info("Memory verified successfully")
                     return memory_id
                 except Exception as verify_error:
-                    logger.warning(f"Memory ID from SSM is invalid: {verify_error}")
+                    logger.warning("Memory ID from SSM is invalid: %s", verify_error)
         except Exception as e:
-            logger.warning(f"Could not retrieve memory ID from SSM: {e}")
+            logger.warning("Could not retrieve memory ID from SSM: %s", e)
         return None
     
     def _find_existing_memory(self) -> str | None:
@@ -1393,14 +1854,16 @@ class MemoryManager:
         try:
             logger.info("Searching for existing memory...")
             memories = self.client.gmcp_client.list_memories()
-            logger.info(f"Found {len(memories.get('memories', []))} total memories")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found %d total memories", len(memories.get('memories', [])))
             
             for memory in memories.get('memories', []):
                 memory_id = memory.get('id')
                 memory_name_from_api = memory.get('name')
                 memory_status = memory.get('status')
-                
-                logger.debug(f"Memory ID: {memory_id}, Name: {memory_name_from_api}, Status: {memory_status}")
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Memory ID: %s, Name: %s, Status: %s", memory_id, memory_name_from_api, memory_status)
                 
                 if memory_status == 'DELETING':
                     continue
@@ -1408,13 +1871,13 @@ class MemoryManager:
                 # Check by name or ID pattern
                 if (memory_name_from_api == self.memory_name or 
                     (memory_name_from_api is None and self.memory_name in memory_id and memory_status == 'ACTIVE')):
-                    logger.info(f"Found existing memory: {memory_id}")
+                    logger.info("Found existing memory: %s", memory_id)
                     self._save_memory_id_to_ssm(memory_id)
                     return memory_id
             
             logger.info("No existing memory found")
         except Exception as e:
-            logger.error(f"Could not list existing memories: {e}")
+            logger.error("Could not list existing memories: %s", e)
         return None
     
     def _create_new_memory(self) -> str | None:
@@ -1431,7 +1894,7 @@ class MemoryManager:
                 event_expiry_days=AgentConfig.MEMORY_EXPIRY_DAYS,
             )
             memory_id = response["id"]
-            logger.info(f"Successfully created memory: {memory_id}")
+            logger.info("Successfully created memory: %s", memory_id)
             
             self._save_memory_id_to_ssm(memory_id)
             return memory_id
@@ -1439,15 +1902,16 @@ class MemoryManager:
             error_str = str(e)
             # Check if memory already exists
             if "already exists" in error_str.lower() or "validation" in error_str.lower():
-                logger.info(f"Memory with name '{self.memory_name}' already exists, attempting to find it...")
+                logger.info("Memory with name '%s' already exists, attempting to find it...", self.memory_name)
                 # Try to find the existing memory again with more thorough search
                 return self._find_existing_memory_by_name()
             else:
-                logger.error(f"Failed to create memory: {e}")
+                logger.error("Failed to create memory: %s", e)
                 return None
     
     def _create_memory_strategies(self) -> list:
         """Create memory strategies configuration."""
+        from bedrock_agentcore.memory.constants import StrategyType
         return [
             {
                 StrategyType.USER_PREFERENCE.value: {
@@ -1468,15 +1932,16 @@ class MemoryManager:
     def _find_existing_memory_by_name(self) -> str | None:
         """Find existing memory by exact name match."""
         try:
-            logger.info(f"Searching for existing memory with name: {self.memory_name}")
+            logger.info("Searching for existing memory with name: %s", self.memory_name)
             memories = self.client.gmcp_client.list_memories()
             
             for memory in memories.get('memories', []):
                 memory_id = memory.get('id')
                 memory_name_from_api = memory.get('name')
                 memory_status = memory.get('status')
-                
-                logger.debug(f"Checking memory - ID: {memory_id}, Name: {memory_name_from_api}, Status: {memory_status}")
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Checking memory - ID: %s, Name: %s, Status: %s", memory_id, memory_name_from_api, memory_status)
                 
                 # Skip memories that are being deleted
                 if memory_status == 'DELETING':
@@ -1484,14 +1949,14 @@ class MemoryManager:
                 
                 # Exact name match
                 if memory_name_from_api == self.memory_name:
-                    logger.info(f"Found existing memory by name: {memory_id}")
+                    logger.info("Found existing memory by name: %s", memory_id)
                     self._save_memory_id_to_ssm(memory_id)
                     return memory_id
             
-            logger.warning(f"No existing memory found with name: {self.memory_name}")
+            logger.warning("No existing memory found with name: %s", self.memory_name)
             return None
         except Exception as e:
-            logger.error(f"Error searching for existing memory: {e}")
+            logger.error("Error searching for existing memory: %s", e)
             return None
 
     def _save_memory_id_to_ssm(self, memory_id: str) -> None:
@@ -1500,7 +1965,7 @@ class MemoryManager:
             put_ssm_parameter(AgentConfig.SSM_MEMORY_ID_PATH, memory_id)
             logger.info("Saved memory ID to SSM")
         except Exception as e:
-            logger.warning(f"Could not save memory ID to SSM: {e}")
+            logger.warning("Could not save memory ID to SSM: %s", e)
 
 def create_or_get_memory_resource():
     """Factory function for memory resource creation."""
@@ -1512,32 +1977,156 @@ def initialize_memory() -> str | None:
     try:
         memory_id = create_or_get_memory_resource()
         if memory_id:
-            logger.info(f"AgentCore Memory ready with ID: {memory_id}")
+            logger.info("AgentCore Memory ready with ID: %s", memory_id)
             return memory_id
         else:
             _log_memory_initialization_error()
             return None
     except Exception as e:
-        logger.error(f"Unexpected error during memory initialization: {e}")
+        logger.error("Unexpected error during memory initialization: %s", e)
         _log_memory_initialization_error()
         return None
 
 def _log_memory_initialization_error():
     """Log memory initialization error with helpful information."""
-    error_messages = [
-        "Failed to create or retrieve memory resource",
-        "Possible causes:",
-        "1. AWS credentials not configured or insufficient permissions",
-        "2. AgentCore Memory service not available in your region",
-        "3. Network connectivity issues",
-        "4. SSM parameter store access issues",
+    logger.warning(
+        "Failed to create or retrieve memory resource\n"
+        "Possible causes:\n"
+        "1. AWS credentials not configured or insufficient permissions\n"
+        "2. AgentCore Memory service not available in your region\n"
+        "3. Network connectivity issues\n"
+        "4. SSM parameter store access issues\n"
         "The agent will continue without memory functionality..."
-    ]
-    for msg in error_messages:
-        logger.warning(msg)
+    )
 
 # Memory ID initialization will be done in main()
 
+# Background writer for memory events: create_event is a full round-trip
+# that otherwise sits on the user-visible turn path. Saves are enqueued and
+# drained by a single daemon thread; _flush_memory_saves gives in-flight
+# writes a short grace period on shutdown.
+_MEMORY_SAVE_QUEUE: queue.Queue = queue.Queue(maxsize=1024)
+_memory_save_thread: threading.Thread | None = None
+_memory_save_lock = threading.Lock()
+
+def _memory_save_worker():
+    while True:
+        item = _MEMORY_SAVE_QUEUE.get()
+        try:
+            if item is None:
+                return
+            client, event_kwargs = item
+            try:
+                client.create_event(**event_kwargs)
+                logger.info("Saved DevOps interaction to memory")
+            except Exception as e:
+                logger.error("Failed to save DevOps interaction: %s", e)
+        finally:
+            _MEMORY_SAVE_QUEUE.task_done()
+
+def _ensure_memory_save_worker():
+    global _memory_save_thread
+    if _memory_save_thread is not None and _memory_save_thread.is_alive():
+        return
+    with _memory_save_lock:
+        if _memory_save_thread is None or not _memory_save_thread.is_alive():
+            _memory_save_thread = threading.Thread(
+                target=_memory_save_worker, daemon=True, name='memory-save'
+            )
+            _memory_save_thread.start()
+
+def _flush_memory_saves(timeout: float = 5.0):
+    """Wait briefly for queued memory writes so exits do not drop them."""
+    thread = _memory_save_thread
+    if thread is None or not thread.is_alive():
+        return
+    deadline = time.monotonic() + timeout
+    while not _MEMORY_SAVE_QUEUE.empty() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+atexit.register(_flush_memory_saves)
+
+# Memory strategies are a control-plane lookup that effectively never
+# changes within a process; cache the derived namespace map per memory so
+# new sessions (and /clear-style resets) skip the RPC. 1h TTL picks up
+# strategy edits without a restart.
+_NAMESPACE_CACHE: dict[str, tuple[float, dict]] = {}
+_NAMESPACE_CACHE_TTL = 3600.0  # seconds
+_namespace_cache_lock = threading.Lock()
+
+def _get_memory_namespaces(client, memory_id: str) -> dict:
+    cached = _NAMESPACE_CACHE.get(memory_id)
+    if cached and time.monotonic() - cached[0] < _NAMESPACE_CACHE_TTL:
+        return cached[1]
+    with _namespace_cache_lock:
+        cached = _NAMESPACE_CACHE.get(memory_id)
+        if cached and time.monotonic() - cached[0] < _NAMESPACE_CACHE_TTL:
+            return cached[1]
+        namespaces = {
+            i["type"]: i["namespaces"][0]
+            for i in client.get_memory_strategies(memory_id)
+        }
+        _NAMESPACE_CACHE[memory_id] = (time.monotonic(), namespaces)
+        return namespaces
+
+
+# Interned role/key constants for message inspection: identity comparison
+# hits CPython's pointer fast path, while role strings decoded from payloads
+# would otherwise compare character by character on every message walked
+_ROLE_USER = sys.intern("user")
+_ROLE_AGENT = sys.intern("agent")
+_KEY_TOOL_RESULT = sys.intern("toolResult")
+
+
+class _QueryContextCache:
+    """Bounded TTL cache of retrieved memory context keyed by normalized query.
+
+    Conversational workloads repeat near-identical queries; serving those
+    from process memory skips one retrieve_memories RPC per namespace.
+    Entries are evicted oldest-first past max_entries and invalidated for an
+    actor whenever a new interaction is saved.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple, tuple[float, list]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        # Case/whitespace-insensitive so trivially rephrased queries hit
+        return " ".join(query.casefold().split())
+
+    def get(self, actor_id: str, query: str, top_k: int) -> list | None:
+        key = (actor_id, self._normalize(query), top_k)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            # Re-insert to refresh LRU position (dicts preserve order)
+            del self._entries[key]
+            self._entries[key] = entry
+            return entry[1]
+
+    def put(self, actor_id: str, query: str, top_k: int, context: list) -> None:
+        key = (actor_id, self._normalize(query), top_k)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), context)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def invalidate_actor(self, actor_id: str) -> None:
+        """Drop cached context for an actor after new events are written."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == actor_id]:
+                del self._entries[key]
+
+
 class EKSAgentMemoryHooks(HookProvider):
     """Memory hooks for EKS Agent"""
 
@@ -1548,41 +2137,83 @@ class EKSAgentMemoryHooks(HookProvider):
         self.client = client
         self.actor_id = actor_id
         self.session_id = session_id
-        self.namespaces = {
-            i["type"]: i["namespaces"][0]
-            for i in self.client.get_memory_strategies(self.memory_id)
-        }
+        # actor_id is fixed for the hook's lifetime, so expand the namespace
+        # templates once instead of re-parsing them on every turn
+        # The retrieval loop only ever iterates pairs sequentially, so a
+        # frozen tuple beats a dict (no hashing, smaller footprint)
+        self.namespaces = tuple(
+            (context_type, namespace.format(actorId=actor_id))
+            for context_type, namespace in _get_memory_namespaces(
+                self.client, self.memory_id
+            ).items()
+        )
+        self._context_cache = _QueryContextCache()
+        # Messages are append-only; remember how far save_eks_interaction
+        # has scanned so each turn only walks the new tail
+        self._last_scanned_idx = 0
+        # Namespace retrievals are independent I/O; fan them out so hook
+        # latency is the slowest RPC rather than the sum of all of them
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, len(self.namespaces)),
+            thread_name_prefix='memory-retrieve',
+        )
 
     def retrieve_eks_context(self, event: MessageAddedEvent):
         """Retrieve EKS context before processing query"""
         messages = event.agent.messages
         if (
-            messages[-1]["role"] == "user"
-            and "toolResult" not in messages[-1]["content"][0]
+            messages[-1]["role"] == _ROLE_USER
+            and _KEY_TOOL_RESULT not in messages[-1]["content"][0]
         ):
             user_query = messages[-1]["content"][0]["text"]
 
             try:
-                all_context = []
-
-                for context_type, namespace in self.namespaces.items():
-                    # *** AGENTCORE MEMORY USAGE *** - Retrieve EKS context from each namespace
-                    memories = self.client.retrieve_memories(
-                        memory_id=self.memory_id,
-                        namespace=namespace.format(actorId=self.actor_id),
-                        query=user_query,
-                        top_k=AgentConfig.CONTEXT_RETRIEVAL_TOP_K,
-                    )
-                    # Post-processing: Format memories into context strings
-                    for memory in memories:
-                        if isinstance(memory, dict):
-                            content = memory.get("content", {})
-                            if isinstance(content, dict):
-                                text = content.get("text", "").strip()
-                                if text:
-                                    all_context.append(
-                                        f"[{context_type.upper()}] {text}"
-                                    )
+                top_k = AgentConfig.CONTEXT_RETRIEVAL_TOP_K
+                all_context = self._context_cache.get(self.actor_id, user_query, top_k)
+                cache_hit = all_context is not None
+                if not cache_hit:
+                    all_context = []
+                    # Local bindings avoid LOAD_GLOBAL per item in the
+                    # post-processing below
+                    _isinstance = isinstance
+                    _dict = dict
+
+                    # *** AGENTCORE MEMORY USAGE *** - Retrieve EKS context from
+                    # each namespace; all namespaces are queried in parallel
+                    futures = {
+                        self._pool.submit(
+                            self.client.retrieve_memories,
+                            memory_id=self.memory_id,
+                            namespace=namespace,
+                            query=user_query,
+                            top_k=top_k,
+                        ): context_type
+                        for context_type, namespace in self.namespaces
+                    }
+                    try:
+                        for future in as_completed(
+                            futures, timeout=AgentConfig.CONTEXT_RETRIEVAL_TIMEOUT
+                        ):
+                            context_type = futures[future]
+                            memories = future.result()
+                            # Post-processing: Format memories into context
+                            # strings; the tag is constant per namespace batch
+                            tag = f"[{context_type.upper()}] "
+                            all_context.extend(
+                                tag + text
+                                for memory in memories
+                                if _isinstance(memory, _dict)
+                                and _isinstance((content := memory.get("content")), _dict)
+                                and (text := content.get("text", "").strip())
+                            )
+                    except FutureTimeoutError:
+                        # A slow namespace must not stall the turn; use
+                        # whatever context arrived in time
+                        for future in futures:
+                            future.cancel()
+                        logger.warning("Memory retrieval timed out; using partial context")
+
+                    self._context_cache.put(self.actor_id, user_query, top_k, all_context)
 
                 # Inject EKS context into the query
                 if all_context:
@@ -1591,35 +2222,43 @@ class EKSAgentMemoryHooks(HookProvider):
                     messages[-1]["content"][0][
                         "text"
                     ] = f"EKS Context:\n{context_text}\n\n{original_text}"
-                    logger.info(f"Retrieved {len(all_context)} EKS context items")
+                    logger.info("Retrieved %d EKS context items", len(all_context))
 
             except Exception as e:
-                logger.error(f"Failed to retrieve EKS context: {e}")
+                logger.error("Failed to retrieve EKS context: %s", e)
 
     def save_eks_interaction(self, event: AfterInvocationEvent):
         """Save EKS Agent interaction after agent response"""
         try:
             messages = event.agent.messages
-            if len(messages) >= 2 and messages[-1]["role"] == "agent":
-                # Get last user query and agent response
+            if len(messages) >= 2 and messages[-1]["role"] == _ROLE_AGENT:
+                # Get last user query and agent response; only the tail added
+                # since the previous invocation needs scanning
+                start = self._last_scanned_idx if self._last_scanned_idx < len(messages) else 0
                 user_query = None
                 agent_response = None
 
-                for msg in reversed(messages):
-                    if msg["role"] == "agent" and not agent_response:
-                        agent_response = msg["content"][0]["text"]
-                    elif (
-                        msg["role"] == "user"
-                        and not user_query
-                        and "toolResult" not in msg["content"][0]
-                    ):
-                        user_query = msg["content"][0]["text"]
-                        break
+                for msg in messages[start:]:
+                    content = msg["content"][0]
+                    role = msg["role"]
+                    if role == _ROLE_AGENT:
+                        # Intermediate tool-use turns lead with a toolUse
+                        # block that has no text; skip them so only the
+                        # final text reply is captured
+                        text = content.get("text")
+                        if text is not None:
+                            agent_response = text
+                    elif role == _ROLE_USER and _KEY_TOOL_RESULT not in content:
+                        user_query = content.get("text")
+                        # Pair the query with the agent reply that follows it
+                        agent_response = None
+
+                self._last_scanned_idx = len(messages)
 
                 if user_query and agent_response:
                     # *** AGENTCORE MEMORY USAGE *** - Save the DevOps interaction
                     # Note: AgentCore Memory requires "ASSISTANT" role, not "AGENT"
-                    self.client.create_event(
+                    event_kwargs = dict(
                         memory_id=self.memory_id,
                         actor_id=self.actor_id,
                         session_id=self.session_id,
@@ -1628,10 +2267,18 @@ class EKSAgentMemoryHooks(HookProvider):
                             (agent_response, "ASSISTANT"),
                         ],
                     )
-                    logger.info("Saved DevOps interaction to memory")
+                    # New events can change what retrieval returns
+                    self._context_cache.invalidate_actor(self.actor_id)
+                    _ensure_memory_save_worker()
+                    try:
+                        _MEMORY_SAVE_QUEUE.put_nowait((self.client, event_kwargs))
+                    except queue.Full:
+                        # Writer is backlogged; fall back to the synchronous path
+                        self.client.create_event(**event_kwargs)
+                        logger.info("Saved DevOps interaction to memory")
 
         except Exception as e:
-            logger.error(f"Failed to save DevOps interaction: {e}")
+            logger.error("Failed to save DevOps interaction: %s", e)
 
     def register_hooks(self, registry: HookRegistry) -> None:
         """Register EKS Agent memory hooks"""
@@ -1641,53 +2288,101 @@ class EKSAgentMemoryHooks(HookProvider):
 
 SESSION_ID = str(uuid.uuid4())
 
-def create_agent_hooks(memory_id: str | None) -> list:
-    """Create agent hooks based on memory availability."""
+# Hook instances are reusable for the lifetime of a session; re-creating one
+# per call would repeat namespace lookup and thread-pool setup
+_hooks_by_session: dict[str, EKSAgentMemoryHooks] = {}
+
+def create_agent_hooks(memory_id: str | None, session_id: str | None = None) -> list:
+    """Create agent hooks based on memory availability.
+
+    Passing the same session_id returns the cached hook instance, so
+    callers that rebuild the agent per request do not re-initialize hooks.
+    """
     if not memory_id:
         logger.info("Running without memory functionality")
         return []
-    
-    session_id = str(uuid.uuid4())
-    memory_hooks = EKSAgentMemoryHooks(
-        memory_id, memory_client, AgentConfig.DEVOPS_USER_ID, session_id
-    )
+
+    if session_id is None:
+        session_id = str(uuid.uuid4())
+
+    memory_hooks = _hooks_by_session.get(session_id)
+    if memory_hooks is None:
+        memory_hooks = EKSAgentMemoryHooks(
+            memory_id, memory_client, AgentConfig.DEVOPS_USER_ID, session_id
+        )
+        _hooks_by_session[session_id] = memory_hooks
     logger.info("Memory hooks enabled")
     return [memory_hooks]
 
+# Short TTL cache for gateway tool listings, keyed by client identity, so
+# interactive exploration does not re-pay a gateway round-trip per call
+_GATEWAY_TOOLS_CACHE: dict[int, tuple[float, list]] = {}
+_GATEWAY_TOOLS_TTL = 60.0  # seconds
+
+def invalidate_gateway_tools_cache():
+    """Drop cached gateway tool listings (call after a connection reset)."""
+    _GATEWAY_TOOLS_CACHE.clear()
+
 def get_full_tools_list(client):
+    """List tools from a client, caching results for a short window."""
+    cached = _GATEWAY_TOOLS_CACHE.get(id(client))
+    if cached and time.monotonic() - cached[0] < _GATEWAY_TOOLS_TTL:
+        return cached[1]
+
+    tools = _fetch_full_tools_list(client)
+    _GATEWAY_TOOLS_CACHE[id(client)] = (time.monotonic(), tools)
+    return tools
+
+def _extract_tools_page(page):
+    """Normalize a list_tools_sync response to (items, pagination_token).
+
+    Dispatches on the response shape once per page instead of re-probing
+    attributes throughout the pagination loop.
+    """
+    if page is None:
+        return [], None
+    if hasattr(page, 'tools'):
+        return list(page.tools), getattr(page, 'pagination_token', None)
+    if hasattr(page, '__iter__'):
+        # A plain list/iterable of tools carries no pagination
+        return list(page), None
+    return [page], None
+
+def _fetch_full_tools_list(client):
     """
     List tools w/ support for pagination
     """
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tools-page')
     try:
-        more_tools = True
         tools = []
-        pagination_token = None
         max_iterations = 10  # Prevent infinite loops
-        iteration = 0
-        
-        while more_tools and iteration < max_iterations:
-            iteration += 1
+        timeout = float(os.environ.get('MCP_TOOL_LIST_TIMEOUT')
+                        or AgentConfig.MCP_TOOL_LIST_TIMEOUT)
+
+        # Pipeline pagination: as soon as a page's token is known, the next
+        # round-trip is issued on the worker while this thread processes the
+        # page already in hand.
+        future = pool.submit(client.list_tools_sync, pagination_token=None)
+        for iteration in range(1, max_iterations + 1):
             print(f"🔍 Fetching MCP tools (iteration {iteration})...")
-            
-            tmp_tools = client.list_tools_sync(pagination_token=pagination_token)
-            
-            if hasattr(tmp_tools, '__iter__'):
-                # If tmp_tools is a list/iterable of tools
-                tools.extend(tmp_tools)
-                more_tools = False  # Assume no pagination if we get a simple list
-            elif hasattr(tmp_tools, 'tools'):
-                # If tmp_tools has a tools attribute
-                tools.extend(tmp_tools.tools)
-                if hasattr(tmp_tools, 'pagination_token') and tmp_tools.pagination_token:
-                    pagination_token = tmp_tools.pagination_token
-                else:
-                    more_tools = False
-            else:
-                # Fallback - treat as single tool or list
-                if tmp_tools:
-                    tools.extend([tmp_tools] if not hasattr(tmp_tools, '__iter__') else tmp_tools)
-                more_tools = False
-                
+
+            page = future.result(timeout=timeout)
+            future = None
+
+            items, pagination_token = _extract_tools_page(page)
+            if pagination_token:
+                future = pool.submit(
+                    client.list_tools_sync, pagination_token=pagination_token
+                )
+            tools.extend(items)
+            if future is None:
+                break
+
+        print(f"✅ Retrieved {len(tools)} MCP tools total")
+        return tools
+
+    except FutureTimeoutError:
+        print(f"⚠️  Tool listing timed out after {timeout}s; returning partial list")
         print(f"✅ Retrieved {len(tools)} MCP tools total")
         return tools
         
@@ -1721,11 +2416,14 @@ def get_full_tools_list(client):
             else:
                 print("ℹ️  MCP tools unavailable")
             return []
+    finally:
+        pool.shutdown(wait=False)
 
 def create_tools_list():
     """Create the list of tools for the agent."""
     tools_list = [
-        websearch, 
+        websearch,
+        list_eks_clusters,
         list_aws_mcp_tools,
         list_agentcore_gateway_tools,
         manage_mcp_config,
@@ -1773,20 +2471,32 @@ def create_tools_list():
     
     return tools_list
 
+# BedrockModel construction builds a bedrock-runtime client (credential
+# resolution + endpoint discovery); reuse instances per model id
+_model_cache: dict[str, BedrockModel] = {}
+
+def _get_bedrock_model(model_id: str) -> BedrockModel:
+    """Return a shared BedrockModel for model_id, creating it on first use."""
+    model = _model_cache.get(model_id)
+    if model is None:
+        model = BedrockModel(
+            model_id=model_id,
+            temperature=AgentConfig.MODEL_TEMPERATURE,
+            max_tokens=AgentConfig.MAX_TOKENS,
+            top_p=AgentConfig.TOP_P,
+            # Stream tokens as they arrive so first output reaches the user
+            # in ms instead of after the full response is generated
+            streaming=True
+        )
+        _model_cache[model_id] = model
+    return model
+
 def create_devops_agent(model_id: str) -> Agent:
     """Create and configure the EKS agent."""
     hooks = create_agent_hooks(memory_id)
-    
-    # Create model with the provided model_id
-    model = BedrockModel(
-        model_id=model_id, 
-        temperature=AgentConfig.MODEL_TEMPERATURE,
-        max_tokens=AgentConfig.MAX_TOKENS,
-        top_p=AgentConfig.TOP_P
-    )
-    
+
     return Agent(
-        model=model,
+        model=_get_bedrock_model(model_id),
         hooks=hooks,
         system_prompt="""You are AWS EKS agent. Help with EKS cluster management, Kubernetes operations, and AWS infrastructure.
 
@@ -1813,6 +2523,33 @@ NON-FUNCTIONAL RULES:
         tools=create_tools_list(),
     )
 
+# Help text is constant apart from three status fields; build the template
+# once at import instead of re-concatenating it on every /help
+_HELP_TEMPLATE = (
+    "🔧 **Available Commands:**\n\n"
+    "**Special Commands:**\n"
+    "• `/tool` or `/tools` - List all MCP tool sources and status\n"
+    "• `/listagentcoregwtools` or `/listgwtools` - List AgentCore Gateway MCP tools with details\n"
+    "• `/help` or `/h` - Show this help message\n"
+    "• `exit`, `quit`, `bye` - Exit the agent\n\n"
+    "**Built-in Tools:**\n"
+    "• `websearch()` - Search the web for information\n\n"
+    "**AWS MCP Configuration Tools:**\n"
+    "• `list_mcp_servers_from_config()` - Detailed AWS MCP server info\n"
+    "• `manage_mcp_config()` - Manage AWS MCP server configuration\n"
+    "• `show_available_mcp_servers()` - Show AWS MCP servers with details\n\n"
+    "**MCP Tool Discovery:**\n"
+    "• `list_aws_mcp_tools()` - List AWS MCP tools (comprehensive AWS services)\n"
+    "• Use `/listagentcoregwtools` command for AgentCore Gateway MCP tools\n\n"
+    "💡 **MCP Tool Sources:**\n"
+    "• AgentCore Gateway: {gateway_status} (ENABLE_MCP_CONFIG)\n"
+    "• AWS MCP: {aws_status} (ENABLE_AWS_MCP)\n"
+    "{server_count_line}"
+    "\n"
+    "🚀 **EKS Expertise:**\n"
+    "• Ask me anything about EKS, Kubernetes, containers, or AWS!"
+)
+
 class ConversationManager:
     """Manages the interactive conversation loop."""
     
@@ -1820,6 +2557,16 @@ class ConversationManager:
         self.agent = agent
         self.bot_name = bot_name
         self.exit_commands = {'exit', 'quit', 'bye'}
+        # One hash lookup per turn instead of chained list scans; aliases
+        # map to the same handler
+        self._commands = {
+            "/tool": self._list_all_mcp_tools,
+            "/tools": self._list_all_mcp_tools,
+            "/listagentcoregwtools": list_agentcore_gateway_tools,
+            "/listgwtools": list_agentcore_gateway_tools,
+            "/help": self._show_help,
+            "/h": self._show_help,
+        }
     
     def _list_all_mcp_tools(self) -> str:
         """List all MCP tools and tool sources available to the agent."""
@@ -1882,38 +2629,17 @@ class ConversationManager:
     
     def _show_help(self) -> str:
         """Show available commands and help information."""
-        help_text = "🔧 **Available Commands:**\n\n"
-        help_text += "**Special Commands:**\n"
-        help_text += "• `/tool` or `/tools` - List all MCP tool sources and status\n"
-        help_text += "• `/listagentcoregwtools` or `/listgwtools` - List AgentCore Gateway MCP tools with details\n"
-        help_text += "• `/help` or `/h` - Show this help message\n"
-        help_text += "• `exit`, `quit`, `bye` - Exit the agent\n\n"
-        
-        help_text += "**Built-in Tools:**\n"
-        help_text += "• `websearch()` - Search the web for information\n\n"
-        
-        help_text += "**AWS MCP Configuration Tools:**\n"
-        help_text += "• `list_mcp_servers_from_config()` - Detailed AWS MCP server info\n"
-        help_text += "• `manage_mcp_config()` - Manage AWS MCP server configuration\n"
-        help_text += "• `show_available_mcp_servers()` - Show AWS MCP servers with details\n\n"
-        
-        help_text += "**MCP Tool Discovery:**\n"
-        help_text += "• `list_aws_mcp_tools()` - List AWS MCP tools (comprehensive AWS services)\n"
-        help_text += "• Use `/listagentcoregwtools` command for AgentCore Gateway MCP tools\n\n"
-        
-        help_text += "💡 **MCP Tool Sources:**\n"
-        help_text += f"• AgentCore Gateway: {'🟢 Connected' if mcp_client else '🔴 Disconnected'} (ENABLE_MCP_CONFIG)\n"
-        help_text += f"• AWS MCP: {'🟢 Enabled' if aws_mcp_manager else '🔴 Disabled'} (ENABLE_AWS_MCP)\n"
-        
         # Only show server count for AWS MCP (which uses config file)
+        server_count_line = ""
         if AgentConfig.ENABLE_AWS_MCP:
             server_count = len(AgentConfig.get_mcp_servers())
-            help_text += f"• AWS MCP Servers: {server_count} configured\n"
-        help_text += "\n"
-        help_text += "🚀 **EKS Expertise:**\n"
-        help_text += "• Ask me anything about EKS, Kubernetes, containers, or AWS!"
-        
-        return help_text
+            server_count_line = f"• AWS MCP Servers: {server_count} configured\n"
+
+        return _HELP_TEMPLATE.format_map({
+            "gateway_status": '🟢 Connected' if mcp_client else '🔴 Disconnected',
+            "aws_status": '🟢 Enabled' if aws_mcp_manager else '🔴 Disabled',
+            "server_count_line": server_count_line,
+        })
     
     def start_conversation(self):
         """Start the interactive conversation loop."""
@@ -1924,31 +2650,23 @@ class ConversationManager:
             while True:
                 try:
                     user_input = input("\nYou > ").strip()
-                    
-                    if user_input.lower() in self.exit_commands:
+                    lowered = user_input.lower()
+
+                    if lowered in self.exit_commands:
                         print("👋 Goodbye!")
                         # Cleanup will be handled by the main function's finally block
                         return  # Return instead of break to exit the function
-                        
+
                     if not user_input:
                         print(f"\n{self.bot_name} > Please ask me something about EKS on AWS!")
                         continue
-                    
+
                     # Handle special commands
-                    if user_input.lower() in ["/tool", "/tools"]:
-                        tool_list = self._list_all_mcp_tools()
-                        print(f"\n{self.bot_name} > {tool_list}")
-                        continue
-                    elif user_input.lower() in ["/listagentcoregwtools", "/listgwtools"]:
-                        # Call the tool function directly
-                        gateway_tools = list_agentcore_gateway_tools()
-                        print(f"\n{self.bot_name} > {gateway_tools}")
-                        continue
-                    elif user_input.lower() in ["/help", "/h"]:
-                        help_text = self._show_help()
-                        print(f"\n{self.bot_name} > {help_text}")
+                    handler = self._commands.get(lowered)
+                    if handler:
+                        print(f"\n{self.bot_name} > {handler()}")
                         continue
-                    
+
                     response = self.agent(user_input)
                     # strands handles the response automatically, no need to print manually
                     
@@ -1957,11 +2675,11 @@ class ConversationManager:
                     # Cleanup will be handled by the main function's finally block
                     return  # Return instead of break to exit the function
                 except Exception as e:
-                    logger.error(f"Error processing user input: {e}")
+                    logger.error("Error processing user input: %s", e)
                     print(f"\n{self.bot_name} > Sorry, I encountered an error: {e}")
                     
         except Exception as e:
-            logger.error(f"Fatal error in conversation loop: {e}")
+            logger.error("Fatal error in conversation loop: %s", e)
             print(f"Fatal error: {e}")
             # Cleanup will be handled by the main function's finally block
 
@@ -1974,7 +2692,7 @@ def setup_gateway_parameters():
     
     # Check current gateway status
     manual_gateway_id = os.getenv("EKS_AGENT_GATEWAY_ID", "eks-agent-agentcore-gw-7uxdeftskt")
-    gateway_client = boto3.client("bedrock-agentcore-control", region_name=REGION)
+    gateway_client = _boto_client("bedrock-agentcore-control", REGION)
     
     try:
         gateway_response = gateway_client.get_gateway(gatewayIdentifier=manual_gateway_id)
@@ -1994,8 +2712,11 @@ def setup_gateway_parameters():
         "/app/eksagent/agentcore/gateway_id": "Gateway ID (Auto-managed)"
     }
     
+    # One GetParameters round-trip instead of one GetParameter per path
+    current_values = get_ssm_parameters_batch(list(params_to_check))
+
     for param_path, description in params_to_check.items():
-        current_value = get_ssm_parameter(param_path)
+        current_value = current_values.get(param_path)
         print(f"\n{description}:")
         print(f"  Parameter: {param_path}")
         print(f"  Current value: {current_value or 'NOT SET'}")
@@ -2021,6 +2742,11 @@ def setup_gateway_parameters():
 
 
 
+# Shared pool for startup handshakes; reused across reinits so abandoned
+# initializations do not accumulate fresh threads
+_startup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='agent-init')
+_STARTUP_INIT_TIMEOUT = 15.0  # seconds per startup handshake
+
 def initialize_agent():
     """Initialize all agent components."""
     global REGION, sts_client, gateway, gateway_id, mcp_client, aws_mcp_manager, memory_id, memory_client
@@ -2029,7 +2755,7 @@ def initialize_agent():
     REGION = AgentConfig.setup_aws_region()
     
     # Initialize AWS clients with proper region
-    sts_client = boto3.client('sts', region_name=REGION)
+    sts_client = _boto_client('sts', REGION)
     
     # Initialize AWS MCP configuration
     print(f"🔧 AWS MCP Integration: {'enabled' if AgentConfig.ENABLE_AWS_MCP else 'disabled'}")
@@ -2045,26 +2771,34 @@ def initialize_agent():
     # Initialize gateway - using manually created gateway
     gateway, gateway_id = use_manual_gateway(REGION)
     
-    # Initialize MCP client only if gateway is available
-    mcp_client = None
-    if gateway and gateway_id:
+    def _init_gateway_mcp_client():
+        """Token exchange, MCP client construction and start, as one chain."""
+        if not (gateway and gateway_id):
+            print("ℹ️  No gateway available - MCP client functionality disabled")
+            return None
         try:
             print(f"🔗 Setting up MCP client for gateway: {gateway_id}")
-            
+
+            # Batch the Cognito parameters into one SSM round-trip
+            token_params = get_ssm_parameters_batch([
+                "/app/eksagent/agentcore/machine_client_id",
+                "/app/eksagent/agentcore/cognito_auth_scope",
+                "/app/eksagent/agentcore/cognito_token_url",
+            ])
             gateway_access_token = get_token(
-                get_ssm_parameter("/app/eksagent/agentcore/machine_client_id"),
+                token_params.get("/app/eksagent/agentcore/machine_client_id"),
                 get_cognito_client_secret(),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_auth_scope"),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_token_url")
+                token_params.get("/app/eksagent/agentcore/cognito_auth_scope"),
+                token_params.get("/app/eksagent/agentcore/cognito_token_url")
             )
-            
+
             print(f"🔍 Debug - Token response: {gateway_access_token}")
-            
+
             # Check if we got a valid token
             if 'error' in gateway_access_token:
                 print(f"❌ Token error: {gateway_access_token['error']}")
                 raise Exception(f"Failed to get access token: {gateway_access_token['error']}")
-            
+
             if 'access_token' not in gateway_access_token:
                 print(f"❌ No access_token in response. Available keys: {list(gateway_access_token.keys())}")
                 raise Exception("No access_token in authentication response")
@@ -2072,44 +2806,43 @@ def initialize_agent():
             print(f"Gateway Endpoint - MCP URL: {gateway['gateway_url']}")
 
             # Set up MCP client
-            mcp_client = MCPClient(
+            from mcp.client.streamable_http import streamablehttp_client
+            client = MCPClient(
                 lambda: streamablehttp_client(
                     gateway['gateway_url'],
                     headers={"Authorization": f"Bearer {gateway_access_token['access_token']}"},
                 )
             )
             print("✅ MCP client configured successfully")
-            
         except Exception as e:
             print(f"⚠️  MCP client setup failed: {e}")
             print("🔄 Continuing without MCP client functionality...")
-            mcp_client = None
-    else:
-        print("ℹ️  No gateway available - MCP client functionality disabled")
+            return None
 
-    # Initialize MCP client if available
-    if mcp_client:
         try:
-            mcp_client.start()
+            client.start()
             print("✅ MCP client started successfully")
+            return client
         except Exception as e:
             print(f"⚠️  MCP client start failed: {str(e)}")
             print("🔄 Continuing without MCP client functionality...")
-            mcp_client = None
+            return None
 
-    # Initialize AWS MCP Manager using the reliable sequential approach
-    aws_mcp_manager = None
-    if AgentConfig.ENABLE_AWS_MCP:
+    def _init_aws_mcp_manager():
+        """AWS MCP manager initialization (independent of the gateway)."""
+        if not AgentConfig.ENABLE_AWS_MCP:
+            print("ℹ️  AWS MCP integration disabled")
+            return None
         try:
             print("🔧 Initializing AWS MCP integration...")
-            
+
             # Verify AWS region is properly configured before MCP initialization
             current_region = os.environ.get('AWS_DEFAULT_REGION', 'not-set')
             print(f"   • AWS region: {current_region}")
-            
+
             # Verify AWS credentials are available
             try:
-                session = boto3.Session()
+                session = _boto_session(REGION)
                 credentials = session.get_credentials()
                 if credentials is None:
                     raise Exception("No AWS credentials found")
@@ -2117,28 +2850,54 @@ def initialize_agent():
             except Exception as cred_error:
                 print(f"   • AWS credentials: ❌ {cred_error}")
                 raise Exception(f"AWS credentials not available: {cred_error}")
-            
-            aws_mcp_manager = AWSMCPManager(AgentConfig.AWS_MCP_CONFIG_PATH)
-            aws_mcp_manager.initialize_aws_mcp_clients()
-            aws_tools_count = len(aws_mcp_manager.get_all_aws_tools())
+
+            manager = AWSMCPManager(AgentConfig.AWS_MCP_CONFIG_PATH, session_pool=_mcp_session_pool)
+            manager.initialize_aws_mcp_clients()
+            aws_tools_count = len(manager.get_all_aws_tools())
             print(f"✅ Added {aws_tools_count} AWS MCP tools")
+            return manager
         except Exception as e:
             print(f"⚠️  AWS MCP initialization failed: {e}")
             print("🔄 Continuing without AWS MCP functionality...")
-            aws_mcp_manager = None
-    else:
-        print("ℹ️  AWS MCP integration disabled")
-    
-    # Initialize model
+            return None
+
+    # The gateway chain and the AWS MCP handshakes are independent; run them
+    # concurrently on the shared startup pool so startup costs the slower of
+    # the two, not their sum. Each branch already degrades to None on failure.
+    mcp_future = _startup_pool.submit(_init_gateway_mcp_client)
+    aws_future = _startup_pool.submit(_init_aws_mcp_manager)
+
+    # Model and memory init proceed while the handshakes are in flight
     current_model_id = AgentConfig.get_model_id()
     print(f"🤖 Using MODEL_ID: {current_model_id}")
     print(f"📝 Model Description: {AgentConfig.list_models()[AgentConfig.SELECTED_MODEL]}")
-    
+
     # Initialize memory
     global memory_client, memory_id
-    memory_client = MemoryClient(region_name=REGION)
+    memory_client = _make_memory_client(REGION)
     memory_id = initialize_memory()
-    
+
+    # Collect the handshakes last; results are assigned on this thread so
+    # globals are never written from the workers
+    try:
+        mcp_client = mcp_future.result(timeout=_STARTUP_INIT_TIMEOUT)
+    except FutureTimeoutError:
+        mcp_future.cancel()
+        print(f"⚠️  MCP client setup timed out after {_STARTUP_INIT_TIMEOUT}s")
+        mcp_client = None
+    except Exception as e:
+        print(f"⚠️  MCP client setup failed: {e}")
+        mcp_client = None
+    try:
+        aws_mcp_manager = aws_future.result(timeout=_STARTUP_INIT_TIMEOUT)
+    except FutureTimeoutError:
+        aws_future.cancel()
+        print(f"⚠️  AWS MCP initialization timed out after {_STARTUP_INIT_TIMEOUT}s")
+        aws_mcp_manager = None
+    except Exception as e:
+        print(f"⚠️  AWS MCP initialization failed: {e}")
+        aws_mcp_manager = None
+
     return current_model_id
 
 def initialize_runtime_components():
@@ -2149,7 +2908,7 @@ def initialize_runtime_components():
     REGION = AgentConfig.setup_aws_region()
     
     # Initialize STS client
-    sts_client = boto3.client('sts', region_name=REGION)
+    sts_client = _boto_client('sts', REGION)
     
     # Setup gateway and MCP (will be disabled by runtime config)
     gateway, gateway_url, gateway_id, mcp_client, aws_mcp_manager = setup_gateway_and_mcp()
@@ -2159,13 +2918,8 @@ def initialize_runtime_components():
     
     # Initialize model
     model_id = AgentConfig.get_model_id()
-    model = BedrockModel(
-        model_id=model_id, 
-        temperature=AgentConfig.MODEL_TEMPERATURE,
-        max_tokens=AgentConfig.MAX_TOKENS,
-        top_p=AgentConfig.TOP_P
-    )
-    
+    model = _get_bedrock_model(model_id)
+
     return model, memory_id, memory_client, mcp_client
 
 def setup_gateway_and_mcp():
@@ -2185,12 +2939,18 @@ def setup_gateway_and_mcp():
     if gateway and gateway_id:
         try:
             print(f"🔗 Setting up MCP client for gateway: {gateway_id}")
-            
+
+            # Batch the Cognito parameters into one SSM round-trip
+            token_params = get_ssm_parameters_batch([
+                "/app/eksagent/agentcore/machine_client_id",
+                "/app/eksagent/agentcore/cognito_auth_scope",
+                "/app/eksagent/agentcore/cognito_token_url",
+            ])
             gateway_access_token = get_token(
-                get_ssm_parameter("/app/eksagent/agentcore/machine_client_id"),
+                token_params.get("/app/eksagent/agentcore/machine_client_id"),
                 get_cognito_client_secret(),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_auth_scope"),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_token_url")
+                token_params.get("/app/eksagent/agentcore/cognito_auth_scope"),
+                token_params.get("/app/eksagent/agentcore/cognito_token_url")
             )
             
             print(f"🔍 Debug - Token response: {gateway_access_token}")
@@ -2207,6 +2967,7 @@ def setup_gateway_and_mcp():
             print(f"Gateway Endpoint - MCP URL: {gateway['gateway_url']}")
 
             # Set up MCP client
+            from mcp.client.streamable_http import streamablehttp_client
             mcp_client = MCPClient(
                 lambda: streamablehttp_client(
                     gateway['gateway_url'],
@@ -2237,18 +2998,24 @@ def setup_gateway_and_mcp():
     
     return gateway, gateway_url, gateway_id, mcp_client, aws_mcp_manager
 
+def _make_memory_client(region: str):
+    """Create a MemoryClient on the shared boto session when supported."""
+    from bedrock_agentcore.memory import MemoryClient
+    try:
+        return MemoryClient(region_name=region, boto3_session=_boto_session(region))
+    except TypeError:
+        # Older bedrock_agentcore releases take no session argument
+        return MemoryClient(region_name=region)
+
 def setup_memory():
     """Setup memory client and initialize memory."""
     global memory_client, memory_id
-    memory_client = MemoryClient(region_name=REGION)
+    memory_client = _make_memory_client(REGION)
     memory_id = initialize_memory()
     return memory_id, memory_client
 
 def main():
     """Main execution function."""
-    import sys
-    import signal
-    
     # Handle command line arguments first
     handle_command_line_args()
     
@@ -2288,7 +3055,6 @@ def main():
             cleanup_all_resources()
         
         # Force exit to prevent hanging
-        import os
         os._exit(0)
 
 if __name__ == "__main__":
@@ -11,12 +11,26 @@ import os
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from operator import attrgetter
+from typing import NamedTuple
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from agent import AgentConfig
-from utils import get_ssm_parameter, get_cognito_client_secret
+from utils import get_ssm_parameter, get_ssm_parameters_batch, get_cognito_client_secret
+
+# orjson parses JSON several times faster than stdlib json; fall back
+# transparently when it is not installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
 # Load environment variables from .env.agents file
 try:
@@ -33,14 +47,142 @@ except Exception as e:
 if not os.environ.get('AWS_DEFAULT_REGION'):
     os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
 
+# Streamlit re-executes the script on every interaction, and each browser tab
+# gets its own session_state. Build the boto3 clients once per process with
+# st.cache_resource so all sessions share the clients and their connection pool.
+@st.cache_resource
+def _boto_config():
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=120,
+        retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    )
+
+@st.cache_resource
+def _runtime_client(region):
+    return boto3.client('bedrock-agentcore', region_name=region, config=_boto_config())
+
+@st.cache_resource
+def _gateway_client(region):
+    return boto3.client('bedrock-agentcore-control', region_name=region, config=_boto_config())
+
+# SSM parameters and the Cognito client secret effectively never change while
+# the app runs; memoize them in Streamlit's own caches so sidebar reruns skip
+# the round-trips entirely (utils' 300s TTL cache still backs a cold fetch)
+@st.cache_data(ttl=3600)
+def _ssm(name):
+    return get_ssm_parameter(name)
+
+@st.cache_data(ttl=3600)
+def _cognito_token_params():
+    # One GetParameters round-trip instead of three sequential GetParameter calls
+    return get_ssm_parameters_batch([
+        "/app/eksagent/agentcore/machine_client_id",
+        "/app/eksagent/agentcore/cognito_auth_scope",
+        "/app/eksagent/agentcore/cognito_token_url",
+    ])
+
+@st.cache_resource
+def _client_secret():
+    return get_cognito_client_secret()
+
+@st.cache_resource(ttl=3600)
+def _mcp_client(gateway_url, access_token):
+    """Started MCP client shared across reruns and sessions.
+
+    Keyed by the access token, so a token refresh naturally builds a new
+    client; the TTL retires clients for expired tokens.
+    """
+    from strands.tools.mcp import MCPClient
+    from mcp.client.streamable_http import streamablehttp_client
+    client = MCPClient(
+        lambda: streamablehttp_client(
+            gateway_url,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+    )
+    client.start()
+    return client
+
+# Static page assets. Streamlit reruns main() on every interaction, so build
+# the CSS string and the example-prompt widget keys once at import instead of
+# re-formatting/re-hashing them per rerun.
+_CSS = """
+    <style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #FF9900;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .sidebar-content {
+        background-color: #F5F5F5;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+    }
+    </style>
+    """
+
+_EXAMPLE_PROMPTS = [
+    (f"example_{hash(p)}", p) for p in (
+        "How do I create an EKS cluster with best practices?",
+        "What are the essential EKS add-ons I should install?",
+        "Help me troubleshoot pod scheduling issues in EKS",
+        "How do I set up ALB Ingress Controller in EKS?",
+        "What's the best way to manage EKS node groups?",
+        "How do I implement cluster autoscaling in EKS?",
+    )
+]
+
+@st.cache_data
+def _render_capabilities():
+    """Static capabilities block; cached so reruns replay the recorded
+    elements instead of re-parsing the markdown."""
+    st.subheader("🎯 Agent Capabilities")
+    st.markdown("""
+        - **EKS Cluster Management**
+        - **Kubernetes Workload Deployment**
+        - **Container Security & Best Practices**
+        - **Kubernetes Troubleshooting**
+        - **EKS Add-ons & Integrations**
+        - **CI/CD for Containers**
+        - **Kubernetes Monitoring**
+        """)
+
+class ToolInfo(NamedTuple):
+    """Compact per-tool record; a fraction of the footprint of a dict per tool."""
+    name: str
+    description: str
+
 class StreamlitAgentInterface:
     """Streamlit interface for the EKS Agent."""
-    
+
     def __init__(self):
         self.region = "us-east-1"
-        self.client = boto3.client('bedrock-agentcore', region_name=self.region)
-        self.gateway_client = boto3.client('bedrock-agentcore-control', region_name=self.region)
+        self.client = _runtime_client(self.region)
+        self.gateway_client = _gateway_client(self.region)
         self._mcp_tools_cache = None
+        # MCP discovery chains get_gateway, SSM, Cognito, and a full MCP
+        # handshake — several seconds that should not block the first render.
+        # Run it on a worker; the sidebar polls and shows a loading state
+        self._mcp_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mcp-tools')
+        self._mcp_future = self._mcp_pool.submit(self._fetch_mcp_tools)
+        # The ARN and gateway id cannot change within a session; compute the
+        # sidebar's runtime info once instead of re-splitting and re-scanning
+        # the same strings on every rerun
+        runtime_arn = self.get_agent_runtime_arn()
+        gateway_id = self.get_agent_gateway_id()
+        self._runtime_info = {
+            "runtime_arn": runtime_arn,
+            "runtime_id": runtime_arn.rpartition("runtime/")[2] or "RUNTIME_ID",
+            "runtime_status": "✅ Active" if "ACCOUNT_ID" not in runtime_arn else "⚠️ Placeholder",
+            "gateway_id": gateway_id,
+            "gateway_status": "✅ Active" if "GATEWAY_ID" not in gateway_id else "⚠️ Placeholder",
+        }
         
     def get_agent_runtime_arn(self):
         """Get the agent runtime ARN for EKS Agent from environment variable."""
@@ -51,7 +193,7 @@ class StreamlitAgentInterface:
     def get_agent_gateway_id(self):
         """Get the agent gateway ID for EKS Agent from SSM parameter."""
         try:
-            gateway_id = get_ssm_parameter("/app/eksagent/agentcore/gateway_id")
+            gateway_id = _ssm("/app/eksagent/agentcore/gateway_id")
             if gateway_id:
                 return gateway_id
         except Exception:
@@ -62,73 +204,74 @@ class StreamlitAgentInterface:
         return gateway_id
     
     def get_runtime_info(self):
-        """Get formatted runtime and gateway information."""
-        runtime_arn = self.get_agent_runtime_arn()
-        gateway_id = self.get_agent_gateway_id()
-        
-        # Extract runtime ID from ARN
-        runtime_id = "RUNTIME_ID"
-        if "runtime/" in runtime_arn:
-            runtime_id = runtime_arn.split("runtime/")[-1]
-        
-        # Check if using actual values or placeholders
-        runtime_status = "✅ Active" if "ACCOUNT_ID" not in runtime_arn else "⚠️ Placeholder"
-        gateway_status = "✅ Active" if "GATEWAY_ID" not in gateway_id else "⚠️ Placeholder"
-        
-        return {
-            "runtime_arn": runtime_arn,
-            "runtime_id": runtime_id,
-            "runtime_status": runtime_status,
-            "gateway_id": gateway_id,
-            "gateway_status": gateway_status
-        }
+        """Get the runtime and gateway info computed once at session init."""
+        return self._runtime_info
     
     def get_mcp_tools_info(self):
-        """Get information about MCP tools available through the AgentCore Gateway."""
+        """Get MCP tools info without blocking; returns a loading status while
+        the background discovery is still running."""
         if self._mcp_tools_cache is not None:
             return self._mcp_tools_cache
-        
+
+        if self._mcp_future is None:
+            # Cache was invalidated (e.g. the refresh button); start over
+            self._mcp_future = self._mcp_pool.submit(self._fetch_mcp_tools)
+            return {"status": "loading", "tools": []}
+
+        try:
+            info = self._mcp_future.result(timeout=0)
+        except FutureTimeoutError:
+            return {"status": "loading", "tools": []}
+        except Exception as e:
+            info = {
+                "status": "error",
+                "message": f"Failed to retrieve MCP tools: {str(e)[:100]}...",
+                "tools": []
+            }
+
+        self._mcp_future = None
+        self._mcp_tools_cache = info
+        return info
+
+    def _fetch_mcp_tools(self):
+        """Discover MCP tools through the AgentCore Gateway (blocking)."""
         try:
+            # Placeholder ARN/gateway values mean nothing is deployed; fail
+            # fast instead of walking the whole get_gateway/token/handshake
+            # chain into guaranteed multi-second timeouts
+            if "ACCOUNT_ID" in self.get_agent_runtime_arn():
+                return {"status": "error", "message": "Not deployed (placeholder runtime ARN)", "tools": []}
+
             gateway_id = self.get_agent_gateway_id()
             if not gateway_id or "GATEWAY_ID" in gateway_id:
-                self._mcp_tools_cache = {"status": "error", "message": "Gateway not configured", "tools": []}
-                return self._mcp_tools_cache
-            
+                return {"status": "error", "message": "Gateway not configured", "tools": []}
+
             # Get gateway details
             gateway_response = self.gateway_client.get_gateway(gatewayIdentifier=gateway_id)
             gateway_url = gateway_response.get("gatewayUrl")
             gateway_status = gateway_response.get("status", "Unknown")
-            
+
             if gateway_status != "READY":
-                self._mcp_tools_cache = {"status": "error", "message": f"Gateway not ready: {gateway_status}", "tools": []}
-                return self._mcp_tools_cache
+                return {"status": "error", "message": f"Gateway not ready: {gateway_status}", "tools": []}
             
             # Try to get authentication token and connect to MCP
-            from strands.tools.mcp import MCPClient
-            from mcp.client.streamable_http import streamablehttp_client
             from agent import get_token
-            
+
+
+            token_params = _cognito_token_params()
             gateway_access_token = get_token(
-                get_ssm_parameter("/app/eksagent/agentcore/machine_client_id"),
-                get_cognito_client_secret(),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_auth_scope"),
-                get_ssm_parameter("/app/eksagent/agentcore/cognito_token_url")
+                token_params.get("/app/eksagent/agentcore/machine_client_id"),
+                _client_secret(),
+                token_params.get("/app/eksagent/agentcore/cognito_auth_scope"),
+                token_params.get("/app/eksagent/agentcore/cognito_token_url")
             )
             
             if 'access_token' not in gateway_access_token:
-                self._mcp_tools_cache = {"status": "error", "message": "Authentication failed", "tools": []}
-                return self._mcp_tools_cache
-            
-            # Create MCP client
-            mcp_client = MCPClient(
-                lambda: streamablehttp_client(
-                    gateway_url,
-                    headers={"Authorization": f"Bearer {gateway_access_token['access_token']}"},
-                )
-            )
+                return {"status": "error", "message": "Authentication failed", "tools": []}
             
-            # Start client and get tools
-            mcp_client.start()
+            # Reuse the started client across reruns; the second sidebar
+            # render skips the TLS + OAuth handshake entirely
+            mcp_client = _mcp_client(gateway_url, gateway_access_token['access_token'])
             tools = mcp_client.list_tools_sync()
             
             # Process tools
@@ -140,64 +283,41 @@ class StreamlitAgentInterface:
             else:
                 raw_tools = []
             
+            # The tools all come from one MCP client version, so detect which
+            # attribute spelling they use once instead of probing up to six
+            # attributes per tool
+            name_getter = desc_getter = None
+            if raw_tools:
+                first = raw_tools[0]
+                name_getter = next(
+                    (attrgetter(a) for a in ('name', '_name', 'tool_name') if hasattr(first, a)), None)
+                desc_getter = next(
+                    (attrgetter(a) for a in ('description', '_description', 'tool_description') if hasattr(first, a)), None)
+
             for tool in raw_tools:
-                # Use the exact same logic as invoke_runtime.py
-                tool_name = "Unknown Tool"
-                tool_desc = "No description available"
-                
-                # Check if it's an MCP tool object
-                if hasattr(tool, 'name'):
-                    tool_name = tool.name
-                elif hasattr(tool, '_name'):
-                    tool_name = tool._name
-                elif hasattr(tool, 'tool_name'):
-                    tool_name = tool.tool_name
-                
-                # Check for description
-                if hasattr(tool, 'description'):
-                    tool_desc = tool.description
-                elif hasattr(tool, '_description'):
-                    tool_desc = tool._description
-                elif hasattr(tool, 'tool_description'):
-                    tool_desc = tool.tool_description
-                
-                # If it's a dict-like object, try to extract info
-                if hasattr(tool, '__dict__'):
-                    tool_dict = tool.__dict__
-                    if 'name' in tool_dict:
-                        tool_name = tool_dict['name']
-                    if 'description' in tool_dict:
-                        tool_desc = tool_dict['description']
-                
-                tool_info = {
-                    "name": tool_name,
-                    "description": tool_desc if tool_desc != "No description available" else "No description available"
-                }
-                
-                tools_list.append(tool_info)
-            
-            # Cleanup
-            try:
-                mcp_client.stop(None, None, None)
-            except:
-                pass
-            
-            self._mcp_tools_cache = {
+                try:
+                    tool_name = name_getter(tool) if name_getter else "Unknown Tool"
+                    tool_desc = (desc_getter(tool) if desc_getter else None) or "No description available"
+                except AttributeError:
+                    tool_name = getattr(tool, 'name', "Unknown Tool")
+                    tool_desc = getattr(tool, 'description', None) or "No description available"
+
+                tools_list.append(ToolInfo(tool_name, tool_desc))
+
+            return {
                 "status": "success",
                 "gateway_url": gateway_url,
                 "gateway_status": gateway_status,
                 "tools": tools_list,
                 "total_tools": len(tools_list)
             }
-            
+
         except Exception as e:
-            self._mcp_tools_cache = {
-                "status": "error", 
+            return {
+                "status": "error",
                 "message": f"Failed to retrieve MCP tools: {str(e)[:100]}...",
                 "tools": []
             }
-        
-        return self._mcp_tools_cache
     
     def invoke_agent(self, prompt, session_id=None):
         """Invoke the agent with a prompt."""
@@ -222,15 +342,18 @@ class StreamlitAgentInterface:
                 response = self.client.invoke_agent_runtime(
                     agentRuntimeArn=agent_runtime_arn,
                     runtimeSessionId=session_id,
-                    payload=json.dumps(payload).encode('utf-8'),
+                    payload=_json_dumps(payload),
                     qualifier="DEFAULT"
                 )
                 
-                # Parse response
-                response_body = response['response'].read()
-                response_data = json.loads(response_body)
-                
-                return response_data
+                # Parse response. Read in chunks into one growable buffer
+                # rather than a single blocking read; both json and orjson
+                # parse the bytearray directly, so no extra bytes copy is made
+                body = response['response']
+                buf = bytearray()
+                for chunk in iter(lambda: body.read(65536), b''):
+                    buf.extend(chunk)
+                return _json_loads(buf)
                 
         except Exception as e:
             st.error(f"❌ Agent invocation failed: {e}")
@@ -247,41 +370,17 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Display MODEL_ID information
+    # Resolve model info once per rerun and reuse the locals below instead
+    # of repeated AgentConfig lookups
     current_model_id = AgentConfig.get_model_id()
+    model_options = AgentConfig.list_models()
+
+    # Display MODEL_ID information
     print(f"🌐 Streamlit App - Backend MODEL_ID: {current_model_id}")
-    print(f"📝 Model Description: {AgentConfig.list_models()[AgentConfig.SELECTED_MODEL]}")
+    print(f"📝 Model Description: {model_options[AgentConfig.SELECTED_MODEL]}")
     
     # Custom CSS for better styling
-    st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #FF9900;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .chat-message {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .user-message {
-        background-color: #E3F2FD;
-        border-left: 4px solid #2196F3;
-    }
-    .agent-message {
-        background-color: #F3E5F5;
-        border-left: 4px solid #9C27B0;
-    }
-    .sidebar-content {
-        background-color: #F5F5F5;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     # Header
     st.markdown('<h1 class="main-header">🚀 AWS EKS Agent</h1>', unsafe_allow_html=True)
@@ -292,6 +391,8 @@ def main():
         st.session_state.messages = []
     if 'session_id' not in st.session_state:
         st.session_state.session_id = f"streamlit-{uuid.uuid4()}-{int(time.time())}"
+        # Sliced once here; the sidebar shows this on every rerun
+        st.session_state.session_id_short = st.session_state.session_id[:20] + "..."
     if 'agent_interface' not in st.session_state:
         st.session_state.agent_interface = StreamlitAgentInterface()
     
@@ -337,20 +438,26 @@ def main():
             with st.expander(f"📋 View {mcp_info['total_tools']} MCP Tools"):
                 for i, tool in enumerate(mcp_info["tools"], 1):
                     # Make tool names more readable by replacing underscores
-                    display_name = tool['name'].replace('___', ' → ').replace('_', ' ').title()
+                    display_name = tool.name.replace('___', ' → ').replace('_', ' ').title()
                     st.markdown(f"**{i}. {display_name}**")
-                    st.code(tool['name'], language="text")  # Show original name in code block
-                    if tool['description'] and tool['description'] != "No description available":
-                        st.caption(tool['description'][:150] + ("..." if len(tool['description']) > 150 else ""))
+                    st.code(tool.name, language="text")  # Show original name in code block
+                    if tool.description and tool.description != "No description available":
+                        st.caption(tool.description[:150] + ("..." if len(tool.description) > 150 else ""))
                     if i < len(mcp_info["tools"]):  # Don't add separator after last item
                         st.markdown("---")
             
             # Gateway status
             st.caption(f"Gateway Status: {mcp_info.get('gateway_status', 'Unknown')}")
             
+        elif mcp_info["status"] == "loading":
+            # Discovery is still running on the worker; poll until it lands
+            with st.spinner("🔄 Discovering MCP tools..."):
+                time.sleep(0.5)
+            st.rerun()
+
         elif mcp_info["status"] == "error":
             st.error(f"❌ {mcp_info.get('message', 'MCP tools unavailable')}")
-            
+
             # Add refresh button
             if st.button("🔄 Refresh MCP Tools"):
                 st.session_state.agent_interface._mcp_tools_cache = None
@@ -361,10 +468,9 @@ def main():
         # Session information
         st.markdown('<div class="sidebar-content">', unsafe_allow_html=True)
         st.subheader("📊 Session Info")
-        st.text(f"Session ID: {st.session_state.session_id[:20]}...")
+        st.text(f"Session ID: {st.session_state.session_id_short}")
         st.text(f"Region: us-east-1")
         st.text(f"Messages: {len(st.session_state.messages)}")
-        current_model_id = AgentConfig.get_model_id()
         st.text(f"Model: {current_model_id.split('.')[-1]}")
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -377,7 +483,6 @@ def main():
             st.session_state.selected_model_key = AgentConfig.SELECTED_MODEL
         
         # Model selector dropdown
-        model_options = AgentConfig.list_models()
         selected_model = st.selectbox(
             "Choose Claude Model:",
             options=list(model_options.keys()),
@@ -404,6 +509,7 @@ def main():
         if st.button("🔄 New Session"):
             st.session_state.messages = []
             st.session_state.session_id = f"streamlit-{uuid.uuid4()}-{int(time.time())}"
+            st.session_state.session_id_short = st.session_state.session_id[:20] + "..."
             st.rerun()
         
         if st.button("📋 Clear Chat"):
@@ -416,17 +522,8 @@ def main():
         st.markdown('<div class="sidebar-content">', unsafe_allow_html=True)
         st.subheader("💡 Example Prompts")
         
-        example_prompts = [
-            "How do I create an EKS cluster with best practices?",
-            "What are the essential EKS add-ons I should install?",
-            "Help me troubleshoot pod scheduling issues in EKS",
-            "How do I set up ALB Ingress Controller in EKS?",
-            "What's the best way to manage EKS node groups?",
-            "How do I implement cluster autoscaling in EKS?"
-        ]
-        
-        for prompt in example_prompts:
-            if st.button(f"📝 {prompt[:30]}...", key=f"example_{hash(prompt)}"):
+        for key, prompt in _EXAMPLE_PROMPTS:
+            if st.button(f"📝 {prompt[:30]}...", key=key):
                 st.session_state.example_prompt = prompt
                 st.rerun()
         
@@ -434,37 +531,19 @@ def main():
         
         # Agent capabilities
         st.markdown('<div class="sidebar-content">', unsafe_allow_html=True)
-        st.subheader("🎯 Agent Capabilities")
-        st.markdown("""
-        - **EKS Cluster Management**
-        - **Kubernetes Workload Deployment**
-        - **Container Security & Best Practices**
-        - **Kubernetes Troubleshooting**
-        - **EKS Add-ons & Integrations**
-        - **CI/CD for Containers**
-        - **Kubernetes Monitoring**
-        """)
+        _render_capabilities()
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Main chat interface
     st.header("💬 Chat with EKS Agent")
     
-    # Display chat messages
+    # Display chat messages. Native chat elements let Streamlit diff the
+    # transcript and skip unchanged turns instead of re-shipping the whole
+    # HTML history on every rerun
     for message in st.session_state.messages:
-        if message["role"] == "user":
-            st.markdown(f'''
-            <div class="chat-message user-message">
-                <strong>👤 You:</strong><br>
-                {message["content"]}
-            </div>
-            ''', unsafe_allow_html=True)
-        else:
-            st.markdown(f'''
-            <div class="chat-message agent-message">
-                <strong>🤖 EKS Agent:</strong><br>
-                {message["content"]}
-            </div>
-            ''', unsafe_allow_html=True)
+        role = "user" if message["role"] == "user" else "assistant"
+        with st.chat_message(role):
+            st.markdown(message["content"])
     
     # Handle example prompt selection
     if hasattr(st.session_state, 'example_prompt'):
@@ -482,12 +561,8 @@ def main():
         st.session_state.messages.append({"role": "user", "content": user_input})
         
         # Display user message immediately
-        st.markdown(f'''
-        <div class="chat-message user-message">
-            <strong>👤 You:</strong><br>
-            {user_input}
-        </div>
-        ''', unsafe_allow_html=True)
+        with st.chat_message("user"):
+            st.markdown(user_input)
         
         # Get agent response
         response = st.session_state.agent_interface.invoke_agent(
@@ -514,12 +589,8 @@ def main():
         st.session_state.messages.append({"role": "agent", "content": agent_message})
         
         # Display agent message
-        st.markdown(f'''
-        <div class="chat-message agent-message">
-            <strong>🤖 EKS Agent:</strong><br>
-            {agent_message}
-        </div>
-        ''', unsafe_allow_html=True)
+        with st.chat_message("assistant"):
+            st.markdown(agent_message)
         
         # Rerun to update the interface
         st.rerun()
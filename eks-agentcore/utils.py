@@ -1,15 +1,55 @@
-import boto3
 import json
 import yaml
 import os
+import time
 from typing import Dict, Any
 
+# boto3 is imported lazily inside each helper so importing this module does
+# not pay AWS SDK import cost on paths that never touch AWS.
+
+# orjson decodes JSON several times faster than stdlib json; fall back
+# transparently when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Shared boto3 clients: constructing a client parses the endpoints JSON and
+# dominates the cost of a single SSM/Cognito call, so build each service
+# client once per process. boto3 clients are thread-safe for our usage.
+_BOTO_CLIENT_CACHE: Dict[str, Any] = {}
+
+
+def _boto_client(service: str):
+    client = _BOTO_CLIENT_CACHE.get(service)
+    if client is None:
+        import boto3
+        client = boto3.client(service)
+        _BOTO_CLIENT_CACHE[service] = client
+    return client
+
+
+# In-process TTL cache for SSM reads: GetParameter is a rate-limited network
+# RPC and the same parameters are looked up repeatedly within a run. Only
+# successful reads are cached so transient failures cannot poison the cache.
+_SSM_CACHE: dict[tuple[str, bool], tuple[float, str]] = {}
+_SSM_CACHE_TTL = 300.0  # seconds
+
 
 def get_ssm_parameter(name: str, with_decryption: bool = True) -> str | None:
-    ssm = boto3.client("ssm")
+    cache_key = (name, with_decryption)
+    cached = _SSM_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < _SSM_CACHE_TTL:
+        return cached[1]
+
+    ssm = _boto_client("ssm")
     try:
         response = ssm.get_parameter(Name=name, WithDecryption=with_decryption)
-        return response["Parameter"]["Value"]
+        value = response["Parameter"]["Value"]
+        _SSM_CACHE[cache_key] = (time.time(), value)
+        return value
     except ssm.exceptions.ParameterNotFound:
         return None
     except Exception as e:
@@ -17,10 +57,47 @@ def get_ssm_parameter(name: str, with_decryption: bool = True) -> str | None:
         return None
 
 
+def get_ssm_parameters_batch(names: list, with_decryption: bool = True) -> Dict[str, str]:
+    """Fetch several SSM parameters in one GetParameters round-trip.
+
+    Returns a name->value dict; missing parameters are simply absent. Fresh
+    cache entries are served locally and fetched values are cached like
+    get_ssm_parameter does.
+    """
+    values: Dict[str, str] = {}
+    to_fetch = []
+    now = time.time()
+    for name in names:
+        cached = _SSM_CACHE.get((name, with_decryption))
+        if cached and now - cached[0] < _SSM_CACHE_TTL:
+            values[name] = cached[1]
+        else:
+            to_fetch.append(name)
+
+    if not to_fetch:
+        return values
+
+    ssm = _boto_client("ssm")
+    try:
+        # GetParameters accepts at most 10 names per call
+        for start in range(0, len(to_fetch), 10):
+            response = ssm.get_parameters(
+                Names=to_fetch[start:start + 10], WithDecryption=with_decryption
+            )
+            for parameter in response["Parameters"]:
+                name = parameter["Name"]
+                value = parameter["Value"]
+                _SSM_CACHE[(name, with_decryption)] = (time.time(), value)
+                values[name] = value
+    except Exception as e:
+        print(f"Error retrieving SSM parameters {to_fetch}: {e}")
+    return values
+
+
 def put_ssm_parameter(
     name: str, value: str, parameter_type: str = "String", with_encryption: bool = False, tier: str = "Standard"
 ) -> None:
-    ssm = boto3.client("ssm")
+    ssm = _boto_client("ssm")
 
     put_params = {
         "Name": name,
@@ -35,9 +112,15 @@ def put_ssm_parameter(
 
     ssm.put_parameter(**put_params)
 
+    # Write through so subsequent reads see the new value immediately
+    for decryption in (True, False):
+        _SSM_CACHE[(name, decryption)] = (time.time(), value)
+
 
 def delete_ssm_parameter(name: str) -> None:
-    ssm = boto3.client("ssm")
+    ssm = _boto_client("ssm")
+    for decryption in (True, False):
+        _SSM_CACHE.pop((name, decryption), None)
     try:
         ssm.delete_parameter(Name=name)
     except ssm.exceptions.ParameterNotFound:
@@ -45,30 +128,43 @@ def delete_ssm_parameter(name: str) -> None:
 
 
 def load_api_spec(file_path: str) -> list:
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = _json_loads(f.read())
     if not isinstance(data, list):
         raise ValueError("Expected a list in the JSON file")
     return data
 
 
 def get_aws_region() -> str:
+    import boto3
     session = boto3.session.Session()
     return session.region_name
 
 
 def get_aws_account_id() -> str:
-    sts = boto3.client("sts")
+    sts = _boto_client("sts")
     return sts.get_caller_identity()["Account"]
 
 
+# The client secret is as stable as the SSM parameters around it; cache it
+# with the same TTL so repeated token setups skip the Cognito round-trip
+_COGNITO_SECRET_CACHE: tuple[float, str] | None = None
+
+
 def get_cognito_client_secret() -> str:
-    client = boto3.client("cognito-idp")
+    global _COGNITO_SECRET_CACHE
+    cached = _COGNITO_SECRET_CACHE
+    if cached and time.time() - cached[0] < _SSM_CACHE_TTL:
+        return cached[1]
+
+    client = _boto_client("cognito-idp")
     response = client.describe_user_pool_client(
         UserPoolId=get_ssm_parameter("/app/devopsagent/agentcore/userpool_id"),
         ClientId=get_ssm_parameter("/app/devopsagent/agentcore/machine_client_id"),
     )
-    return response["UserPoolClient"]["ClientSecret"]
+    secret = response["UserPoolClient"]["ClientSecret"]
+    _COGNITO_SECRET_CACHE = (time.time(), secret)
+    return secret
 
 
 def read_config(file_path: str) -> Dict[str, Any]:
@@ -4,11 +4,13 @@ Amazon Bedrock AgentCore Runtime version of the VPC Agent.
 This version wraps the existing agent for deployment to Amazon Bedrock AgentCore Runtime.
 """
 
+import functools
 import logging
 import os
 import json
+import time
 from typing import Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import the BedrockAgentCoreApp wrapper
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
@@ -44,18 +46,62 @@ logger.info(f"Runtime MCP Configuration - ENABLE_AWS_MCP: {AgentConfig.ENABLE_AW
 # Initialize the BedrockAgentCoreApp
 app = BedrockAgentCoreApp()
 
+# Response timestamps only need second precision, so format at most once
+# per second instead of calling the deprecated datetime.utcnow() on every
+# request (and up to four times per error path)
+_last_ts = (0, '')
+
+
+def _now_iso() -> str:
+    global _last_ts
+    t = int(time.time())
+    if _last_ts[0] != t:
+        _last_ts = (t, datetime.fromtimestamp(t, timezone.utc).isoformat())
+    return _last_ts[1]
+
+
+# Runtime components (model, memory, MCP client) involve boto3 client
+# construction and SSM lookups; build them once and reuse on any warm
+# reload path so reinitialization is a no-op
+_CACHED_COMPONENTS = None
+
+
+def reset_runtime_components():
+    """Drop the cached runtime components so the next create rebuilds them."""
+    global _CACHED_COMPONENTS
+    _CACHED_COMPONENTS = None
+    reset_tools_cache()
+
+
+# Rebuilding the tools list re-opens MCP connections; AgentCore Runtime
+# reuses warm containers, so key the list on the MCP flags and build it
+# once per configuration
+@functools.lru_cache(maxsize=4)
+def _tools_for(config_key):
+    return create_tools_list()
+
+
+def reset_tools_cache():
+    """Drop cached tools lists so the next create rebuilds them."""
+    _tools_for.cache_clear()
+
+
 # Create the agent instance with all existing functionality
 def create_runtime_agent():
     """Create the runtime agent with memory and tools."""
+    global _CACHED_COMPONENTS
     try:
-        # Initialize runtime components
-        model, memory_id, memory_client, mcp_client = agent.initialize_runtime_components()
-        
+        # Initialize runtime components (cached across warm reloads)
+        if _CACHED_COMPONENTS is None:
+            _CACHED_COMPONENTS = agent.initialize_runtime_components()
+        model, memory_id, memory_client, mcp_client = _CACHED_COMPONENTS
+
         # Create hooks (memory functionality)
         hooks = create_agent_hooks(memory_id)
         
-        # Create tools list (websearch, MCP tools, etc.)
-        tools = create_tools_list()
+        # Create tools list (websearch, MCP tools, etc.), cached per MCP
+        # configuration
+        tools = _tools_for((AgentConfig.ENABLE_MCP_CONFIG, AgentConfig.ENABLE_AWS_MCP))
         
         # Create agent with existing configuration
         runtime_agent = Agent(
@@ -89,6 +135,42 @@ except Exception as e:
     logger.error(f"❌ Runtime agent initialization failed: {e}")
     runtime_agent = None
 
+class _LazyPreview:
+    """Defers str(obj) (and the 200-char truncation) until a log handler
+    actually formats the record; str() on an AgentResult can walk a large
+    tool-call trace."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return str(self.obj)[:200]
+
+
+def _extract_message_text(response) -> str:
+    """Pull the text out of an AgentResult, whatever shape it arrived in.
+
+    Ordered fast paths: the common case (message dict with a content list)
+    returns after two checks instead of walking the old nested ladder.
+    """
+    msg = getattr(response, 'message', None)
+    if msg is None:
+        return str(response)
+    if isinstance(msg, dict):
+        content = msg.get('content')
+        if not isinstance(content, list):
+            return str(msg)
+    else:
+        content = getattr(msg, 'content', None)
+        if not isinstance(content, list):
+            return str(msg)
+    # join is O(n) where repeated += on a str can degrade to O(n^2)
+    message_text = ''.join(
+        c['text'] for c in content if isinstance(c, dict) and 'text' in c
+    )
+    return message_text or str(response)
+
+
 @app.entrypoint
 def invoke(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -101,83 +183,65 @@ def invoke(payload: Dict[str, Any]) -> Dict[str, Any]:
         JSON response with the agent's response
     """
     try:
-        logger.info(f"Received payload: {payload}")
-        
-        # Check if agent is available
+        # Check if agent is available; the error branches never need the
+        # payload, so don't stringify it before failing fast
         if runtime_agent is None:
             return {
                 "error": "Agent not initialized properly",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "status": "error"
             }
-        
+
         # Extract user message from payload
         user_message = payload.get("prompt", "")
         session_id = payload.get("session_id", "runtime-session")
-        
+
         if not user_message:
             error_response = {
                 "error": "No prompt found in input. Please provide a 'prompt' key in the payload.",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "status": "error"
             }
-            logger.warning(f"Empty prompt, returning: {error_response}")
+            logger.warning("Empty prompt, returning: %s", error_response)
             return error_response
-        
+
+        # %-style args defer formatting the (possibly large) payload until a
+        # handler actually accepts a DEBUG record
+        logger.debug("Received payload: %s", payload)
+
         logger.info(f"Processing request: {user_message[:100]}...")
         
         # Process the message with the memory-enabled runtime agent
         try:
             response = runtime_agent(user_message)
-            logger.info(f"Agent response type: {type(response)}")
-            logger.info(f"Agent response: {str(response)[:200]}...")
+            logger.info("Agent response (%s): %s...",
+                        type(response), _LazyPreview(response))
         except Exception as agent_error:
             logger.error(f"Agent processing error: {agent_error}", exc_info=True)
             return {
                 "error": f"Agent processing failed: {str(agent_error)}",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "status": "error"
             }
         
         # Format the response
         try:
             # Extract the message text from the AgentResult
-            message_text = ""
-            if hasattr(response, 'message'):
-                if isinstance(response.message, dict):
-                    # Handle dictionary format
-                    if 'content' in response.message and isinstance(response.message['content'], list):
-                        # Extract text from content list
-                        for content_item in response.message['content']:
-                            if isinstance(content_item, dict) and 'text' in content_item:
-                                message_text += content_item['text']
-                    else:
-                        message_text = str(response.message)
-                elif hasattr(response.message, 'content') and isinstance(response.message.content, list):
-                    # Handle object format with content list
-                    for content_item in response.message.content:
-                        if isinstance(content_item, dict) and 'text' in content_item:
-                            message_text += content_item['text']
-                else:
-                    message_text = str(response.message)
-            else:
-                message_text = str(response)
-            
-            # Fallback if we couldn't extract text
-            if not message_text:
-                message_text = str(response)
-            
+            message_text = _extract_message_text(response)
+
             result = {
                 "message": message_text,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "model": AgentConfig.get_model_id(),
                 "session_id": session_id,
                 "status": "success"
             }
             
-            # Add tool usage information if available
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                result["tools_used"] = [tool.name for tool in response.tool_calls]
+            # Add tool usage information if available; getattr reads the
+            # attribute once instead of the hasattr probe plus re-access
+            tool_calls = getattr(response, 'tool_calls', None)
+            if tool_calls:
+                result["tools_used"] = [tool.name for tool in tool_calls]
             
             logger.info("Request processed successfully")
             return result
@@ -186,7 +250,7 @@ def invoke(payload: Dict[str, Any]) -> Dict[str, Any]:
             logger.error(f"Response formatting error: {format_error}")
             return {
                 "error": f"Response formatting failed: {str(format_error)}",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "status": "error"
             }
         
@@ -194,7 +258,7 @@ def invoke(payload: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(f"Unexpected error processing request: {e}", exc_info=True)
         return {
             "error": f"Unexpected error: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "status": "error"
         }
 
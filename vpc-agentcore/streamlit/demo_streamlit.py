@@ -8,24 +8,33 @@ import os
 import sys
 from datetime import datetime
 
-# Set AWS region
-os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
-
 def demo_streamlit_features():
     """Demonstrate the key features of the Streamlit frontend."""
-    
-    print("🚀 AWS VPC Agent - Streamlit Frontend Demo")
-    print("=" * 50)
-    
-    print("\n📋 Key Features:")
-    print("✅ Modern web interface with AWS-themed styling")
-    print("✅ Real-time chat interface with message history")
-    print("✅ Pre-built example prompts for common DevOps questions")
-    print("✅ Session management with unique identifiers")
-    print("✅ Direct integration with deployed AgentCore Runtime")
-    print("✅ Responsive design for desktop and mobile")
-    
-    print("\n🎯 Example Prompts Available:")
+
+    # Set AWS region here rather than at import time so merely importing
+    # the module doesn't mutate the process environment; setdefault keeps
+    # an explicitly configured region
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    session_stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+
+    # The report is buffered and emitted in one write: dozens of separate
+    # print calls each pay a write syscall (plus flush on a line-buffered
+    # TTY) and can interleave under piped output
+    lines = [
+        "🚀 AWS VPC Agent - Streamlit Frontend Demo",
+        "=" * 50,
+        "",
+        "📋 Key Features:",
+        "✅ Modern web interface with AWS-themed styling",
+        "✅ Real-time chat interface with message history",
+        "✅ Pre-built example prompts for common DevOps questions",
+        "✅ Session management with unique identifiers",
+        "✅ Direct integration with deployed AgentCore Runtime",
+        "✅ Responsive design for desktop and mobile",
+        "",
+        "🎯 Example Prompts Available:",
+    ]
+
     example_prompts = [
         "How do I design a multi-tier VPC architecture?",
         "What's the difference between ALB and NLB?",
@@ -34,11 +43,10 @@ def demo_streamlit_features():
         "What are best practices for VPC security groups?",
         "How do I configure Transit Gateway for hub-and-spoke?"
     ]
-    
-    for i, prompt in enumerate(example_prompts, 1):
-        print(f"  {i}. {prompt}")
-    
-    print("\n🛠️ Agent Capabilities:")
+
+    lines.extend(f"  {i}. {prompt}" for i, prompt in enumerate(example_prompts, 1))
+
+    lines += ["", "🛠️ Agent Capabilities:"]
     capabilities = [
         "VPC Design & Architecture",
         "Subnets & Route Tables",
@@ -49,48 +57,53 @@ def demo_streamlit_features():
         "DNS & Route 53 Integration",
         "Network Troubleshooting"
     ]
-    
-    for capability in capabilities:
-        print(f"  • {capability}")
-    
-    print("\n🚀 How to Launch:")
-    print("1. Using the launch script:")
-    print("   ./run_streamlit.sh")
-    print("\n2. Manual launch:")
-    print("   streamlit run streamlit_app.py")
-    print("\n3. Access the web interface:")
-    print("   http://localhost:8501")
-    
-    print("\n💡 Interface Highlights:")
-    print("• Chat-based interaction with the VPC Agent")
-    print("• Sidebar with session controls and quick actions")
-    print("• Example prompts for easy getting started")
-    print("• Real-time loading indicators and response timestamps")
-    print("• Session management (new session, clear chat)")
-    print("• Mobile-friendly responsive design")
-    
-    print("\n🔧 Technical Details:")
-    print(f"• Streamlit version: Latest (>=1.28.0)")
-    print(f"• AWS Region: {os.environ.get('AWS_DEFAULT_REGION', 'Not set')}")
-    print(f"• Integration: Direct with AgentCore Runtime")
-    print(f"• Session ID format: streamlit-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
-    
-    print("\n📊 Performance:")
-    print("• Simple queries: 2-5 seconds")
-    print("• Complex queries: 5-15 seconds") 
-    print("• Web search queries: 30-60 seconds")
-    print("• Memory usage: ~50-100MB")
-    
-    print("\n🎨 UI Components:")
-    print("• Header with AWS VPC Agent branding")
-    print("• Main chat interface with message bubbles")
-    print("• Sidebar with controls and information")
-    print("• Footer with project links")
-    print("• Custom CSS with AWS orange theme (#FF9900)")
-    
-    print("\n" + "=" * 50)
-    print("🌟 Ready to launch your Streamlit frontend!")
-    print("Run: ./run_streamlit.sh")
+    lines.extend(f"  • {capability}" for capability in capabilities)
+
+    lines += [
+        "",
+        "🚀 How to Launch:",
+        "1. Using the launch script:",
+        "   ./run_streamlit.sh",
+        "",
+        "2. Manual launch:",
+        "   streamlit run streamlit_app.py",
+        "",
+        "3. Access the web interface:",
+        "   http://localhost:8501",
+        "",
+        "💡 Interface Highlights:",
+        "• Chat-based interaction with the VPC Agent",
+        "• Sidebar with session controls and quick actions",
+        "• Example prompts for easy getting started",
+        "• Real-time loading indicators and response timestamps",
+        "• Session management (new session, clear chat)",
+        "• Mobile-friendly responsive design",
+        "",
+        "🔧 Technical Details:",
+        "• Streamlit version: Latest (>=1.28.0)",
+        f"• AWS Region: {os.environ.get('AWS_DEFAULT_REGION', 'Not set')}",
+        "• Integration: Direct with AgentCore Runtime",
+        f"• Session ID format: streamlit-{session_stamp}",
+        "",
+        "📊 Performance:",
+        "• Simple queries: 2-5 seconds",
+        "• Complex queries: 5-15 seconds",
+        "• Web search queries: 30-60 seconds",
+        "• Memory usage: ~50-100MB",
+        "",
+        "🎨 UI Components:",
+        "• Header with AWS VPC Agent branding",
+        "• Main chat interface with message bubbles",
+        "• Sidebar with controls and information",
+        "• Footer with project links",
+        "• Custom CSS with AWS orange theme (#FF9900)",
+        "",
+        "=" * 50,
+        "🌟 Ready to launch your Streamlit frontend!",
+        "Run: ./run_streamlit.sh",
+    ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
-    demo_streamlit_features()
\ No newline at end of file
+    demo_streamlit_features()
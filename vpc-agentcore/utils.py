@@ -1,15 +1,34 @@
-import boto3
 import json
 import yaml
 import os
+import time
 from typing import Dict, Any
 
+# boto3 is imported lazily inside each helper so importing this module does
+# not pay AWS SDK import cost on paths that never touch AWS.
+
+
+# In-process TTL cache for SSM reads: GetParameter is a rate-limited network
+# RPC and the deploy script re-reads the same parameters across repeated
+# runs of a build session. Only successful reads are cached so transient
+# failures cannot poison the cache.
+_SSM_CACHE: dict[tuple[str, bool], tuple[float, str]] = {}
+_SSM_CACHE_TTL = 300.0  # seconds
+
 
 def get_ssm_parameter(name: str, with_decryption: bool = True) -> str | None:
+    cache_key = (name, with_decryption)
+    cached = _SSM_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < _SSM_CACHE_TTL:
+        return cached[1]
+
+    import boto3
     ssm = boto3.client("ssm")
     try:
         response = ssm.get_parameter(Name=name, WithDecryption=with_decryption)
-        return response["Parameter"]["Value"]
+        value = response["Parameter"]["Value"]
+        _SSM_CACHE[cache_key] = (time.time(), value)
+        return value
     except ssm.exceptions.ParameterNotFound:
         return None
     except Exception as e:
@@ -17,9 +36,48 @@ def get_ssm_parameter(name: str, with_decryption: bool = True) -> str | None:
         return None
 
 
+def get_ssm_parameters_batch(names: list, with_decryption: bool = True) -> Dict[str, str]:
+    """Fetch several SSM parameters in one GetParameters round-trip.
+
+    Returns a name->value dict; missing parameters are simply absent. Fresh
+    cache entries are served locally and fetched values are cached like
+    get_ssm_parameter does.
+    """
+    values: Dict[str, str] = {}
+    to_fetch = []
+    now = time.time()
+    for name in names:
+        cached = _SSM_CACHE.get((name, with_decryption))
+        if cached and now - cached[0] < _SSM_CACHE_TTL:
+            values[name] = cached[1]
+        else:
+            to_fetch.append(name)
+
+    if not to_fetch:
+        return values
+
+    import boto3
+    ssm = boto3.client("ssm")
+    try:
+        # GetParameters accepts at most 10 names per call
+        for start in range(0, len(to_fetch), 10):
+            response = ssm.get_parameters(
+                Names=to_fetch[start:start + 10], WithDecryption=with_decryption
+            )
+            for parameter in response["Parameters"]:
+                name = parameter["Name"]
+                value = parameter["Value"]
+                _SSM_CACHE[(name, with_decryption)] = (time.time(), value)
+                values[name] = value
+    except Exception as e:
+        print(f"Error retrieving SSM parameters {to_fetch}: {e}")
+    return values
+
+
 def put_ssm_parameter(
     name: str, value: str, parameter_type: str = "String", with_encryption: bool = False, tier: str = "Standard"
 ) -> None:
+    import boto3
     ssm = boto3.client("ssm")
 
     put_params = {
@@ -35,9 +93,16 @@ def put_ssm_parameter(
 
     ssm.put_parameter(**put_params)
 
+    # Write through so subsequent reads see the new value immediately
+    for decryption in (True, False):
+        _SSM_CACHE[(name, decryption)] = (time.time(), value)
+
 
 def delete_ssm_parameter(name: str) -> None:
+    import boto3
     ssm = boto3.client("ssm")
+    for decryption in (True, False):
+        _SSM_CACHE.pop((name, decryption), None)
     try:
         ssm.delete_parameter(Name=name)
     except ssm.exceptions.ParameterNotFound:
@@ -53,16 +118,19 @@ def load_api_spec(file_path: str) -> list:
 
 
 def get_aws_region() -> str:
+    import boto3
     session = boto3.session.Session()
     return session.region_name
 
 
 def get_aws_account_id() -> str:
+    import boto3
     sts = boto3.client("sts")
     return sts.get_caller_identity()["Account"]
 
 
 def get_cognito_client_secret() -> str:
+    import boto3
     client = boto3.client("cognito-idp")
     response = client.describe_user_pool_client(
         UserPoolId=get_ssm_parameter("/app/devopsagent/agentcore/userpool_id"),